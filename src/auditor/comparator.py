@@ -7,7 +7,6 @@ from enum import Enum
 from ..models.para_item import PARAItem, ItemType, ItemSource, CategoryType
 from ..utils.name_matcher import NameMatcher
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -160,10 +159,16 @@ class ItemComparator:
             current_group = [item]
             processed.add(id(item))
             
-            # Find similar items
+            # Find similar items, matching each distinct name only once since
+            # the same project usually appears under one name in every tool
+            name_matches = {}
             for other_item in items:
                 if id(other_item) not in processed:
-                    if self.name_matcher.is_match(item.name, other_item.name):
+                    matched = name_matches.get(other_item.name)
+                    if matched is None:
+                        matched = self.name_matcher.is_match(item.name, other_item.name)
+                        name_matches[other_item.name] = matched
+                    if matched:
                         current_group.append(other_item)
                         processed.add(id(other_item))
             
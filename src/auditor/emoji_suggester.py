@@ -7,7 +7,6 @@ from enum import Enum
 
 from ..models.para_item import PARAItem, ItemType, CategoryType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
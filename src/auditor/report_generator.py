@@ -7,10 +7,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 from ..models.para_item import ItemSource, ItemType
 from .comparator import ComparisonResult, Inconsistency, InconsistencyType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -579,37 +583,27 @@ class JSONFormatter(ReportFormatter):
                 for inc in result.inconsistencies
             ],
             'item_groups': [
-                [
-                    {
-                        'name': item.name,
-                        'raw_name': item.raw_name,
-                        'type': item.type.value,
-                        'is_active': item.is_active,
-                        'category': item.category.value,
-                        'source': item.source.value,
-                        'has_emoji': item.has_emoji(),
-                        'metadata': item.metadata
-                    }
-                    for item in group
-                ]
+                [item.to_dict() for item in group]
                 for group in result.item_groups
             ],
-            'orphaned_items': [
-                {
-                    'name': item.name,
-                    'raw_name': item.raw_name,
-                    'type': item.type.value,
-                    'is_active': item.is_active,
-                    'category': item.category.value,
-                    'source': item.source.value,
-                    'has_emoji': item.has_emoji(),
-                    'metadata': item.metadata
-                }
-                for item in result.orphaned_items
-            ],
+            'orphaned_items': [item.to_dict() for item in result.orphaned_items],
             'statistics': self._calculate_statistics(result)
         }
 
+        return self._dumps(report_data)
+
+    def _dumps(self, report_data: Dict[str, Any]) -> str:
+        """Serialize report data, using orjson when it is installed."""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if self.pretty_print:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(report_data, option=option).decode('utf-8')
+            except TypeError:
+                # Fall back to the standard library for values orjson rejects
+                pass
+
         if self.pretty_print:
             return json.dumps(report_data, indent=2, ensure_ascii=False)
         else:
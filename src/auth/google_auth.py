@@ -43,6 +43,9 @@ class GoogleAuthenticator:
         # Ensure credentials directory exists
         self.credentials_dir.mkdir(parents=True, exist_ok=True)
         
+        # Valid credentials already loaded this run, keyed by account type
+        self._credentials: Dict[str, Credentials] = {}
+        
     def authenticate_account(self, account_type: str) -> Credentials:
         """
         Authenticate a Google account (work or personal).
@@ -59,6 +62,10 @@ class GoogleAuthenticator:
         if account_type not in ['work', 'personal']:
             raise GoogleAuthError(f"Invalid account type: {account_type}")
             
+        cached = self._credentials.get(account_type)
+        if cached and cached.valid:
+            return cached
+            
         logger.info(f"Authenticating {account_type} Google account")
         
         # Check for existing credentials
@@ -67,6 +74,7 @@ class GoogleAuthenticator:
         
         if creds and creds.valid:
             logger.info(f"Using existing valid credentials for {account_type} account")
+            self._credentials[account_type] = creds
             return creds
             
         # Refresh credentials if they exist but are expired
@@ -75,6 +83,7 @@ class GoogleAuthenticator:
                 logger.info(f"Refreshing expired credentials for {account_type} account")
                 creds.refresh(Request())
                 self._save_credentials(creds, token_path)
+                self._credentials[account_type] = creds
                 return creds
             except Exception as e:
                 logger.warning(f"Failed to refresh credentials: {e}")
@@ -83,6 +92,7 @@ class GoogleAuthenticator:
         # Perform OAuth flow for new/invalid credentials
         creds = self._perform_oauth_flow(account_type)
         self._save_credentials(creds, token_path)
+        self._credentials[account_type] = creds
         
         return creds
     
@@ -271,6 +281,7 @@ class GoogleAuthenticator:
     def revoke_credentials(self, account_type: str) -> bool:
         """Revoke stored credentials for an account."""
         token_path = self.credentials_dir / f"{account_type}_drive_token.pickle"
+        self._credentials.pop(account_type, None)
         
         try:
             if token_path.exists():
@@ -315,6 +326,10 @@ class GoogleAuthenticator:
     
     def is_authenticated(self, account_type: str) -> bool:
         """Check if account is already authenticated with valid credentials."""
+        cached = self._credentials.get(account_type)
+        if cached and cached.valid:
+            return True
+            
         token_path = self.credentials_dir / f"{account_type}_drive_token.pickle"
         
         if not token_path.exists():
@@ -326,12 +341,14 @@ class GoogleAuthenticator:
             
         # Check if credentials are valid or can be refreshed
         if creds.valid:
+            self._credentials[account_type] = creds
             return True
             
         if creds.expired and creds.refresh_token:
             try:
                 creds.refresh(Request())
                 self._save_credentials(creds, token_path)
+                self._credentials[account_type] = creds
                 return True
             except Exception:
                 return False
@@ -8,7 +8,6 @@ from pathlib import Path
 
 from ..models.para_item import PARAItem, ItemType, ItemSource, CategoryType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -54,39 +53,39 @@ class AppleNotesConnector:
                 logger.error(f"AppleScript error: {folder_data['error']}")
                 return []
             
-            para_items = []
+            rows = []
             
             # Process Projects folders (active items)
             if 'projects' in folder_data:
                 for folder_name in folder_data['projects']:
-                    para_item = PARAItem(
-                        name=folder_name,
-                        type=ItemType.PROJECT,
-                        is_active=True,
-                        category=CategoryType.PERSONAL,  # Default, will be corrected during comparison
-                        source=ItemSource.APPLE_NOTES,
-                        metadata={
+                    rows.append({
+                        'name': folder_name,
+                        'type': ItemType.PROJECT,
+                        'is_active': True,
+                        'category': CategoryType.PERSONAL,  # Default, will be corrected during comparison
+                        'source': ItemSource.APPLE_NOTES,
+                        'metadata': {
                             'parent_folder': 'Projects',
                             'folder_type': 'project'
                         }
-                    )
-                    para_items.append(para_item)
+                    })
             
             # Process Areas folders (inactive items)
             if 'areas' in folder_data:
                 for folder_name in folder_data['areas']:
-                    para_item = PARAItem(
-                        name=folder_name,
-                        type=ItemType.AREA,
-                        is_active=False,
-                        category=CategoryType.PERSONAL,  # Default, will be corrected during comparison
-                        source=ItemSource.APPLE_NOTES,
-                        metadata={
+                    rows.append({
+                        'name': folder_name,
+                        'type': ItemType.AREA,
+                        'is_active': False,
+                        'category': CategoryType.PERSONAL,  # Default, will be corrected during comparison
+                        'source': ItemSource.APPLE_NOTES,
+                        'metadata': {
                             'parent_folder': 'Areas',
                             'folder_type': 'area'
                         }
-                    )
-                    para_items.append(para_item)
+                    })
+            
+            para_items = PARAItem.bulk_create(rows)
             
             logger.info(f"Fetched {len(para_items)} folders from Apple Notes")
             return para_items
@@ -8,7 +8,6 @@ from google.oauth2.credentials import Credentials
 
 from ..models.para_item import PARAItem, ItemType, ItemSource, CategoryType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -63,7 +62,7 @@ class GDriveConnector:
             
             # Get all folders within the base folder
             folders = self._get_folders_in_directory(base_folder['id'])
-            para_items = []
+            rows = []
             
             for folder in folders:
                 # Determine if folder is active (starred)
@@ -95,15 +94,16 @@ class GDriveConnector:
                     # Log that we found a shortcut
                     logger.debug(f"Found shortcut '{folder['name']}' pointing to {shortcut_details.get('targetId', 'unknown target')}")
                 
-                para_item = PARAItem(
-                    name=folder['name'],
-                    type=ItemType.PROJECT if is_active else ItemType.AREA,
-                    is_active=is_active,
-                    category=CategoryType.WORK if self.account_type == 'work' else CategoryType.PERSONAL,
-                    source=ItemSource.GDRIVE_WORK if self.account_type == 'work' else ItemSource.GDRIVE_PERSONAL,
-                    metadata=metadata
-                )
-                para_items.append(para_item)
+                rows.append({
+                    'name': folder['name'],
+                    'type': ItemType.PROJECT if is_active else ItemType.AREA,
+                    'is_active': is_active,
+                    'category': CategoryType.WORK if self.account_type == 'work' else CategoryType.PERSONAL,
+                    'source': ItemSource.GDRIVE_WORK if self.account_type == 'work' else ItemSource.GDRIVE_PERSONAL,
+                    'metadata': metadata
+                })
+            
+            para_items = PARAItem.bulk_create(rows)
             
             # Count shortcuts vs regular folders for logging
             shortcut_count = sum(1 for item in para_items if item.metadata.get('is_shortcut', False))
@@ -6,9 +6,21 @@ from todoist_api_python.api import TodoistAPI
 
 from ..models.para_item import CategoryType, ItemSource, ItemType, PARAItem
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Code point ranges treated as emoji when checking project name prefixes
+_EMOJI_RANGES = (
+    (0x1F300, 0x1F9FF),  # Miscellaneous Symbols and Pictographs
+    (0x2600, 0x26FF),    # Miscellaneous Symbols
+    (0x2700, 0x27BF),    # Dingbats
+    (0x1F000, 0x1F02F),  # Mahjong Tiles
+    (0x1F0A0, 0x1F0FF),  # Playing Cards
+    (0x1F100, 0x1F64F),  # Miscellaneous Symbols and Pictographs
+    (0x1F680, 0x1F6FF),  # Transport and Map Symbols
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+)
+
 
 class TodoistConnector:
     """Connector for Todoist API to fetch projects and tasks."""
@@ -230,19 +242,7 @@ class TodoistConnector:
         try:
             # Check if first character is in emoji ranges
             code_point = ord(first_char)
-            emoji_ranges = [
-                (0x1F300, 0x1F9FF),  # Miscellaneous Symbols and Pictographs
-                (0x2600, 0x26FF),    # Miscellaneous Symbols
-                (0x2700, 0x27BF),    # Dingbats
-                (0x1F000, 0x1F02F),  # Mahjong Tiles
-                (0x1F0A0, 0x1F0FF),  # Playing Cards
-                (0x1F100, 0x1F64F),  # Miscellaneous Symbols and Pictographs
-                (0x1F680, 0x1F6FF),  # Transport and Map Symbols
-                (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
-                (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
-            ]
-
-            for start, end in emoji_ranges:
+            for start, end in _EMOJI_RANGES:
                 if start <= code_point <= end:
                     return True
 
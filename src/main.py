@@ -3,8 +3,10 @@
 import argparse
 import logging
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .auditor.comparator import ItemComparator
 from .auditor.report_generator import ReportGenerator
@@ -15,21 +17,31 @@ from .connectors.apple_notes_connector import AppleNotesConnector
 from .connectors.gdrive_connector import GDriveConnector
 from .connectors.todoist_connector import TodoistConnector
 from .models.para_item import CategoryType, ItemSource, ItemType, PARAItem
+from .utils.item_cache import ItemCache
 from .utils.spinner import spinner
 
 
-def setup_logging(verbose: bool = False) -> None:
-    """Set up logging configuration."""
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = 'para_auditor.log'
+
+
+def setup_logging(verbose: bool = False, file_logging: bool = False) -> None:
+    """Set up logging configuration.
+
+    The log file is only attached when ``file_logging`` is set; modes that
+    talk to external services call ``enable_file_logging`` instead, so quick
+    invocations such as ``--create-config`` never touch the log file.
+    """
     log_level = logging.DEBUG if verbose else logging.WARNING
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if file_logging:
+        handlers.append(logging.FileHandler(LOG_FILE, delay=True))
 
     logging.basicConfig(
         level=log_level,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('para_auditor.log')
-        ]
+        format=LOG_FORMAT,
+        handlers=handlers
     )
 
     # Reduce noise from external libraries
@@ -48,6 +60,20 @@ def setup_logging(verbose: bool = False) -> None:
         logging.getLogger('src.auditor.comparator').setLevel(logging.WARNING)
 
 
+def enable_file_logging() -> None:
+    """Attach the log file handler to the root logger if not already present.
+
+    The file is opened lazily on the first emitted record.
+    """
+    root_logger = logging.getLogger()
+    if any(isinstance(handler, logging.FileHandler) for handler in root_logger.handlers):
+        return
+
+    file_handler = logging.FileHandler(LOG_FILE, delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root_logger.addHandler(file_handler)
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -68,15 +94,19 @@ Examples:
     mode_group = parser.add_mutually_exclusive_group()
     mode_group.add_argument(
         '--setup',
-        action='store_true',
+        action='store_const',
+        const='setup',
+        dest='mode',
         help='Initialize OAuth flows and create default configuration'
     )
     mode_group.add_argument(
         '--audit',
-        action='store_true',
-        default=True,
+        action='store_const',
+        const='audit',
+        dest='mode',
         help='Run audit (default mode)'
     )
+    parser.set_defaults(mode='audit')
 
     # Configuration options
     parser.add_argument(
@@ -171,6 +201,20 @@ Examples:
         action='store_true',
         help='Show what would be audited without making API calls'
     )
+
+    # Caching options
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        metavar='SECONDS',
+        default=0,
+        help='Reuse items collected within the last SECONDS instead of re-fetching (default: 0, disabled)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Neither read nor write the collected item cache'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -182,6 +226,7 @@ Examples:
 
 def handle_setup_mode(config_manager: ConfigManager) -> int:
     """Handle setup mode operations."""
+    enable_file_logging()
     logger = logging.getLogger(__name__)
 
     try:
@@ -321,111 +366,137 @@ def handle_setup_mode(config_manager: ConfigManager) -> int:
         return 1
 
 
-def collect_all_data_verbose(config_manager: ConfigManager, args: argparse.Namespace, google_auth: GoogleAuthenticator) -> List[PARAItem]:
-    """Collect data with verbose progress output."""
-    all_items = []
+def resolve_next_action_label(config_manager: ConfigManager, args: argparse.Namespace) -> Optional[str]:
+    """Determine the next action label, or None if next action checks are skipped."""
+    # CLI override takes precedence
+    next_action_label = config_manager.next_action_label
+    if hasattr(args, 'next_action_label') and args.next_action_label:
+        next_action_label = args.next_action_label
 
-    print("📥 Collecting data from sources...")
+    # Skip next actions if requested
+    if hasattr(args, 'skip_next_actions') and args.skip_next_actions:
+        next_action_label = None  # This will disable next action checking
 
-    # Collect from Todoist
-    if not args.dry_run:
-        print("  • Fetching Todoist projects...")
+    return next_action_label
 
-        # Determine next action label (CLI override takes precedence)
-        next_action_label = config_manager.next_action_label
-        if hasattr(args, 'next_action_label') and args.next_action_label:
-            next_action_label = args.next_action_label
 
-        # Skip next actions if requested
-        if hasattr(args, 'skip_next_actions') and args.skip_next_actions:
-            print("    Skipping next action checks as requested")
-            next_action_label = None  # This will disable next action checking
+def build_source_fetchers(
+    config_manager: ConfigManager,
+    google_auth: GoogleAuthenticator,
+    next_action_label: Optional[str]
+) -> List[Tuple[str, Callable[[], List[PARAItem]]]]:
+    """Build (source key, fetch function) pairs for every data source."""
+    # Resolve credentials up front so any OAuth flow runs on the main thread
+    work_credentials = google_auth.get_credentials('work')
+    personal_credentials = google_auth.get_credentials('personal')
+    base_folder_name = config_manager.gdrive_base_folder_name
 
+    def fetch_todoist() -> List[PARAItem]:
         todoist_connector = TodoistConnector(
             config_manager.todoist_token,
             next_action_label=next_action_label or "next"
         )
-        todoist_items = todoist_connector.get_projects()
-        all_items.extend(todoist_items)
-
-        # Show next action info if enabled
-        if next_action_label and not (hasattr(args, 'skip_next_actions') and args.skip_next_actions):
-            print(f"    Found {len(todoist_items)} Todoist projects (checking @{next_action_label} labels)")
-        else:
-            print(f"    Found {len(todoist_items)} Todoist projects")
+        return todoist_connector.get_projects()
 
-    # Collect from Google Drive (Work)
-    if not args.dry_run:
-        print("  • Fetching work Google Drive folders...")
-        work_credentials = google_auth.get_credentials('work')
+    def fetch_work_drive() -> List[PARAItem]:
         work_connector = GDriveConnector(work_credentials, 'work')
-        work_items = work_connector.get_para_folders(config_manager.gdrive_base_folder_name)
-        all_items.extend(work_items)
-        print(f"    Found {len(work_items)} work folders")
-
-    # Collect from Google Drive (Personal)
-    if not args.dry_run:
-        print("  • Fetching personal Google Drive folders...")
-        personal_credentials = google_auth.get_credentials('personal')
+        return work_connector.get_para_folders(base_folder_name)
+
+    def fetch_personal_drive() -> List[PARAItem]:
         personal_connector = GDriveConnector(personal_credentials, 'personal')
-        personal_items = personal_connector.get_para_folders(config_manager.gdrive_base_folder_name)
-        all_items.extend(personal_items)
-        print(f"    Found {len(personal_items)} personal folders")
+        return personal_connector.get_para_folders(base_folder_name)
 
-    # Collect from Apple Notes
-    if not args.dry_run:
-        print("  • Fetching Apple Notes folders...")
+    def fetch_apple_notes() -> List[PARAItem]:
         notes_connector = AppleNotesConnector()
-        notes_items = notes_connector.get_para_folders()
-        all_items.extend(notes_items)
-        print(f"    Found {len(notes_items)} Apple Notes folders")
-
+        return notes_connector.get_para_folders()
+
+    return [
+        ('todoist', fetch_todoist),
+        ('work_drive', fetch_work_drive),
+        ('personal_drive', fetch_personal_drive),
+        ('apple_notes', fetch_apple_notes),
+    ]
+
+
+def fetch_sources_concurrently(
+    fetchers: List[Tuple[str, Callable[[], List[PARAItem]]]],
+    on_complete: Optional[Callable[[str, List[PARAItem]], None]] = None
+) -> List[PARAItem]:
+    """Run source fetchers in parallel threads and return items in source order.
+
+    The fetchers are I/O bound, so total time is bounded by the slowest source.
+    A failing source does not cancel the others; the first error is re-raised
+    once every fetcher has finished.
+    """
+    logger = logging.getLogger(__name__)
+    results: Dict[str, List[PARAItem]] = {}
+    errors = []
+
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = {executor.submit(fetch): key for key, fetch in fetchers}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to fetch items from {key}: {e}")
+                errors.append(e)
+                continue
+
+            if on_complete:
+                on_complete(key, results[key])
+
+    if errors:
+        raise errors[0]
+
+    # Keep a stable source order regardless of completion order
+    all_items = []
+    for key, _ in fetchers:
+        all_items.extend(results[key])
     return all_items
 
 
-def collect_all_data_silent(config_manager: ConfigManager, args: argparse.Namespace, google_auth: GoogleAuthenticator) -> List[PARAItem]:
-    """Collect data silently (no console output)."""
-    all_items = []
+def collect_all_data_verbose(config_manager: ConfigManager, args: argparse.Namespace, google_auth: GoogleAuthenticator) -> List[PARAItem]:
+    """Collect data with verbose progress output."""
+    print("📥 Collecting data from sources...")
 
-    # Collect from Todoist
-    if not args.dry_run:
-        # Determine next action label (CLI override takes precedence)
-        next_action_label = config_manager.next_action_label
-        if hasattr(args, 'next_action_label') and args.next_action_label:
-            next_action_label = args.next_action_label
+    if args.dry_run:
+        return []
 
-        # Skip next actions if requested
-        if hasattr(args, 'skip_next_actions') and args.skip_next_actions:
-            next_action_label = None  # This will disable next action checking
+    next_action_label = resolve_next_action_label(config_manager, args)
 
-        todoist_connector = TodoistConnector(
-            config_manager.todoist_token,
-            next_action_label=next_action_label or "next"
-        )
-        todoist_items = todoist_connector.get_projects()
-        all_items.extend(todoist_items)
+    print("  • Fetching Todoist projects...")
+    if hasattr(args, 'skip_next_actions') and args.skip_next_actions:
+        print("    Skipping next action checks as requested")
+    print("  • Fetching work Google Drive folders...")
+    print("  • Fetching personal Google Drive folders...")
+    print("  • Fetching Apple Notes folders...")
 
-    # Collect from Google Drive (Work)
-    if not args.dry_run:
-        work_credentials = google_auth.get_credentials('work')
-        work_connector = GDriveConnector(work_credentials, 'work')
-        work_items = work_connector.get_para_folders(config_manager.gdrive_base_folder_name)
-        all_items.extend(work_items)
+    def report_progress(key: str, items: List[PARAItem]) -> None:
+        if key == 'todoist':
+            if next_action_label:
+                print(f"    Found {len(items)} Todoist projects (checking @{next_action_label} labels)")
+            else:
+                print(f"    Found {len(items)} Todoist projects")
+        elif key == 'work_drive':
+            print(f"    Found {len(items)} work folders")
+        elif key == 'personal_drive':
+            print(f"    Found {len(items)} personal folders")
+        else:
+            print(f"    Found {len(items)} Apple Notes folders")
 
-    # Collect from Google Drive (Personal)
-    if not args.dry_run:
-        personal_credentials = google_auth.get_credentials('personal')
-        personal_connector = GDriveConnector(personal_credentials, 'personal')
-        personal_items = personal_connector.get_para_folders(config_manager.gdrive_base_folder_name)
-        all_items.extend(personal_items)
+    fetchers = build_source_fetchers(config_manager, google_auth, next_action_label)
+    return fetch_sources_concurrently(fetchers, on_complete=report_progress)
 
-    # Collect from Apple Notes
-    if not args.dry_run:
-        notes_connector = AppleNotesConnector()
-        notes_items = notes_connector.get_para_folders()
-        all_items.extend(notes_items)
 
-    return all_items
+def collect_all_data_silent(config_manager: ConfigManager, args: argparse.Namespace, google_auth: GoogleAuthenticator) -> List[PARAItem]:
+    """Collect data silently (no console output)."""
+    if args.dry_run:
+        return []
+
+    next_action_label = resolve_next_action_label(config_manager, args)
+    fetchers = build_source_fetchers(config_manager, google_auth, next_action_label)
+    return fetch_sources_concurrently(fetchers)
 
 
 def compare_items_verbose(filtered_items: List[PARAItem], args: argparse.Namespace):
@@ -447,8 +518,88 @@ def compare_items_silent(filtered_items: List[PARAItem], args: argparse.Namespac
     return comparator.compare_items(filtered_items)
 
 
+def check_audit_authentication(config_manager: ConfigManager, verbose_mode: bool) -> Optional[GoogleAuthenticator]:
+    """Check that Todoist and both Google Drive accounts are reachable.
+
+    Returns:
+        The Google authenticator, or None if any service needs attention
+    """
+    # Initialize authenticators for status checking
+    google_auth = GoogleAuthenticator(config_manager)
+    todoist_auth = TodoistAuthenticator(config_manager)
+
+    # Authentication check (only in verbose mode)
+    if verbose_mode:
+        print("🔐 Authentication Status:")
+        print("-" * 25)
+
+        # Todoist status
+        todoist_valid = todoist_auth.test_connection()
+        print(f"  • Todoist API: {'✅ Connected' if todoist_valid else '❌ Not connected'}")
+
+        # Google Drive status
+        work_auth = google_auth.is_authenticated('work')
+        personal_auth = google_auth.is_authenticated('personal')
+        print(f"  • Work Google Drive: {'✅ Authenticated' if work_auth else '❌ Not authenticated'}")
+        print(f"  • Personal Google Drive: {'✅ Authenticated' if personal_auth else '❌ Not authenticated'}")
+    else:
+        # Silent authentication check
+        todoist_valid = todoist_auth.test_connection()
+        work_auth = google_auth.is_authenticated('work')
+        personal_auth = google_auth.is_authenticated('personal')
+
+    if not (todoist_valid and work_auth and personal_auth):
+        print("❌ Authentication check failed")
+        print("The following services need attention:")
+
+        # Provide detailed Todoist reason if available
+        if not todoist_valid:
+            details = {}
+            try:
+                details = todoist_auth.validate_connection_detailed() or {}
+            except Exception:
+                details = {}
+
+            if not details.get('token_configured', True):
+                print("  • Todoist: API token not configured")
+            elif details.get('token_configured') and not details.get('token_valid', False):
+                print("  • Todoist: API token is invalid")
+            elif details.get('error'):
+                print(f"  • Todoist: {details.get('error')}")
+            else:
+                print("  • Todoist: Not connected")
+
+            # Verbose-mode setup reminders for Todoist
+            if verbose_mode:
+                print("    - Add your token to config.yaml under todoist.api_token")
+                print("    - Get the token from Todoist Settings → Integrations")
+                print("    - Then run: para-auditor --setup")
+
+        # Google Drive account-specific status
+        if not work_auth:
+            print("  • Work Google Drive: Not authenticated")
+            if verbose_mode:
+                print("    - Ensure OAuth client secrets exist at:")
+                print(f"      {config_manager.work_client_secrets_path}")
+                print("    - In Google Cloud Console, enable Drive API and create Desktop OAuth credentials")
+                print("    - Then run: para-auditor --setup and sign in with your work account domain")
+        if not personal_auth:
+            print("  • Personal Google Drive: Not authenticated")
+            if verbose_mode:
+                print("    - Ensure OAuth client secrets exist at:")
+                print(f"      {config_manager.personal_client_secrets_path}")
+                print("    - In Google Cloud Console, enable Drive API and create Desktop OAuth credentials")
+                print("    - Then run: para-auditor --setup and sign in with your personal account")
+
+        print("\n💡 Run 'para-auditor --setup' to configure authentication")
+        return None
+
+    return google_auth
+
+
 def handle_audit_mode(config_manager: ConfigManager, args: argparse.Namespace) -> int:
     """Handle audit mode with three output modes: default (animation), quiet, or verbose."""
+    enable_file_logging()
     logger = logging.getLogger(__name__)
 
     # Determine output mode early for error handling
@@ -461,86 +612,40 @@ def handle_audit_mode(config_manager: ConfigManager, args: argparse.Namespace) -
         config_manager.load_config()
         logger.info("Configuration loaded successfully")
 
-        # Initialize authenticators for status checking
-        google_auth = GoogleAuthenticator(config_manager)
-        todoist_auth = TodoistAuthenticator(config_manager)
-
-        # Authentication check (only in verbose mode)
-        if verbose_mode:
-            print("🔐 Authentication Status:")
-            print("-" * 25)
-
-            # Todoist status
-            todoist_valid = todoist_auth.test_connection()
-            print(f"  • Todoist API: {'✅ Connected' if todoist_valid else '❌ Not connected'}")
-
-            # Google Drive status
-            work_auth = google_auth.is_authenticated('work')
-            personal_auth = google_auth.is_authenticated('personal')
-            print(f"  • Work Google Drive: {'✅ Authenticated' if work_auth else '❌ Not authenticated'}")
-            print(f"  • Personal Google Drive: {'✅ Authenticated' if personal_auth else '❌ Not authenticated'}")
-        else:
-            # Silent authentication check
-            todoist_valid = todoist_auth.test_connection()
-            work_auth = google_auth.is_authenticated('work')
-            personal_auth = google_auth.is_authenticated('personal')
-
-        if not (todoist_valid and work_auth and personal_auth):
-            print("❌ Authentication check failed")
-            print("The following services need attention:")
-
-            # Provide detailed Todoist reason if available
-            if not todoist_valid:
-                details = {}
-                try:
-                    details = todoist_auth.validate_connection_detailed() or {}
-                except Exception:
-                    details = {}
-
-                if not details.get('token_configured', True):
-                    print("  • Todoist: API token not configured")
-                elif details.get('token_configured') and not details.get('token_valid', False):
-                    print("  • Todoist: API token is invalid")
-                elif details.get('error'):
-                    print(f"  • Todoist: {details.get('error')}")
-                else:
-                    print("  • Todoist: Not connected")
-
-                # Verbose-mode setup reminders for Todoist
-                if verbose_mode:
-                    print("    - Add your token to config.yaml under todoist.api_token")
-                    print("    - Get the token from Todoist Settings → Integrations")
-                    print("    - Then run: para-auditor --setup")
-
-            # Google Drive account-specific status
-            if not work_auth:
-                print("  • Work Google Drive: Not authenticated")
-                if verbose_mode:
-                    print("    - Ensure OAuth client secrets exist at:")
-                    print(f"      {config_manager.work_client_secrets_path}")
-                    print("    - In Google Cloud Console, enable Drive API and create Desktop OAuth credentials")
-                    print("    - Then run: para-auditor --setup and sign in with your work account domain")
-            if not personal_auth:
-                print("  • Personal Google Drive: Not authenticated")
-                if verbose_mode:
-                    print("    - Ensure OAuth client secrets exist at:")
-                    print(f"      {config_manager.personal_client_secrets_path}")
-                    print("    - In Google Cloud Console, enable Drive API and create Desktop OAuth credentials")
-                    print("    - Then run: para-auditor --setup and sign in with your personal account")
-
-            print("\n💡 Run 'para-auditor --setup' to configure authentication")
-            return 1
+        # Reuse recently collected items when the cache is enabled
+        item_cache = None
+        cache_key = None
+        all_items = None
+        if args.cache_ttl > 0 and not args.no_cache and not args.dry_run:
+            item_cache = ItemCache(args.cache_ttl)
+            cache_key = ItemCache.config_key(config_manager.config_data, {
+                'next_action_label': args.next_action_label,
+                'skip_next_actions': args.skip_next_actions
+            })
+            all_items = item_cache.load(cache_key)
+            if all_items is not None and verbose_mode:
+                print(f"\n📦 Using {len(all_items)} cached items from {item_cache.cache_path}")
+
+        # Data collection with appropriate output mode; only a fresh
+        # collection needs the services to be reachable
+        if all_items is None:
+            google_auth = check_audit_authentication(config_manager, verbose_mode)
+            if google_auth is None:
+                return 1
 
-        # Data collection with appropriate output mode
-        if verbose_mode:
-            print("\n🔍 Starting PARA Audit...")
-            print("-" * 23)
-            all_items = collect_all_data_verbose(config_manager, args, google_auth)
-        elif quiet_mode:
-            all_items = collect_all_data_silent(config_manager, args, google_auth)
-        else:  # animation_mode (default)
-            with spinner("🔄 Auditing PARA organization"):
+            if verbose_mode:
+                print("\n🔍 Starting PARA Audit...")
+                print("-" * 23)
+                all_items = collect_all_data_verbose(config_manager, args, google_auth)
+            elif quiet_mode:
                 all_items = collect_all_data_silent(config_manager, args, google_auth)
+            else:  # animation_mode (default)
+                with spinner("🔄 Auditing PARA organization"):
+                    all_items = collect_all_data_silent(config_manager, args, google_auth)
+
+            # Save before comparison, which updates item categories in place
+            if item_cache is not None:
+                item_cache.save(cache_key, all_items)
 
         # Apply filters
         filtered_items = apply_filters(all_items, args)
@@ -612,59 +717,72 @@ def handle_audit_mode(config_manager: ConfigManager, args: argparse.Namespace) -
 
 
 def apply_filters(items: List[PARAItem], args: argparse.Namespace) -> List[PARAItem]:
-    """Apply command-line filters to items."""
-    filtered_items = items
-
+    """Apply command-line filters to items in a single pass."""
     # Filter by category
     if args.work_only:
-        filtered_items = [item for item in filtered_items if item.category == CategoryType.WORK]
+        category = CategoryType.WORK
     elif args.personal_only:
-        filtered_items = [item for item in filtered_items if item.category == CategoryType.PERSONAL]
+        category = CategoryType.PERSONAL
+    else:
+        category = None
 
     # Filter by type
     if args.projects_only:
-        filtered_items = [item for item in filtered_items if item.type == ItemType.PROJECT]
+        item_type = ItemType.PROJECT
     elif args.areas_only:
-        filtered_items = [item for item in filtered_items if item.type == ItemType.AREA]
+        item_type = ItemType.AREA
+    else:
+        item_type = None
+
+    if category is None and item_type is None:
+        return items
 
-    return filtered_items
+    return [
+        item for item in items
+        if (category is None or item.category == category)
+        and (item_type is None or item.type == item_type)
+    ]
 
 
 def print_audit_configuration(config_manager: ConfigManager, args: argparse.Namespace) -> None:
     """Print audit configuration for dry run mode."""
-    print("\n📊 Audit Configuration:")
-    print(f"  • Work Domain: {config_manager.work_domain}")
-    print(f"  • Personal Domain: {config_manager.personal_domain}")
-    print(f"  • Projects Folder: {config_manager.projects_folder}")
-    print(f"  • Areas Folder: {config_manager.areas_folder}")
-    print(f"  • Similarity Threshold: {args.threshold}")
-    print(f"  • Report Format: {getattr(args, 'format', 'markdown')}")
+    lines = [
+        "\n📊 Audit Configuration:",
+        f"  • Work Domain: {config_manager.work_domain}",
+        f"  • Personal Domain: {config_manager.personal_domain}",
+        f"  • Projects Folder: {config_manager.projects_folder}",
+        f"  • Areas Folder: {config_manager.areas_folder}",
+        f"  • Similarity Threshold: {args.threshold}",
+        f"  • Report Format: {getattr(args, 'format', 'markdown')}",
+    ]
 
     # Show next action configuration
     next_action_label = config_manager.next_action_label
     if hasattr(args, 'next_action_label') and args.next_action_label:
         next_action_label = args.next_action_label
-        print(f"  • Next Action Label: @{next_action_label} (CLI override)")
+        lines.append(f"  • Next Action Label: @{next_action_label} (CLI override)")
     elif hasattr(args, 'skip_next_actions') and args.skip_next_actions:
-        print("  • Next Action Check: Disabled (CLI override)")
+        lines.append("  • Next Action Check: Disabled (CLI override)")
     else:
-        print(f"  • Next Action Label: @{next_action_label}")
+        lines.append(f"  • Next Action Label: @{next_action_label}")
 
     if args.work_only:
-        print("  • Filter: Work items only")
+        lines.append("  • Filter: Work items only")
     elif args.personal_only:
-        print("  • Filter: Personal items only")
+        lines.append("  • Filter: Personal items only")
 
     if args.projects_only:
-        print("  • Filter: Projects only")
+        lines.append("  • Filter: Projects only")
     elif args.areas_only:
-        print("  • Filter: Areas only")
+        lines.append("  • Filter: Areas only")
 
     # Show all areas option
     if args.show_all_areas:
-        print("  • Show All Areas: Yes")
+        lines.append("  • Show All Areas: Yes")
     else:
-        print("  • Show All Areas: No (default)")
+        lines.append("  • Show All Areas: No (default)")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def print_project_alignment_view(all_items: List[PARAItem], comparison_result) -> None:
@@ -768,23 +886,61 @@ def get_todoist_item_issues(todoist_item: PARAItem, matching_items: Dict[ItemSou
 
 def print_audit_summary(result) -> None:
     """Print audit summary to console."""
-    print("\n📈 Audit Summary:")
-    print(f"  • Consistency Score: {result.consistency_score:.1%}")
-    print(f"  • Total Items: {result.total_items}")
-    print(f"  • Consistent Items: {result.consistent_items}")
-    print(f"  • Issues Found: {len(result.inconsistencies)}")
-
-    if result.inconsistencies:
-        print(f"    - High Priority: {result.high_severity_count}")
-        print(f"    - Medium Priority: {result.medium_severity_count}")
-        print(f"    - Low Priority: {result.low_severity_count}")
-
-    if result.consistency_score >= 0.9:
-        print("  🎉 Excellent consistency!")
-    elif result.consistency_score >= 0.7:
-        print("  👍 Good consistency with room for improvement")
+    consistency_score = result.consistency_score
+    inconsistencies = result.inconsistencies
+    lines = [
+        "\n📈 Audit Summary:",
+        f"  • Consistency Score: {consistency_score:.1%}",
+        f"  • Total Items: {result.total_items}",
+        f"  • Consistent Items: {result.consistent_items}",
+        f"  • Issues Found: {len(inconsistencies)}",
+    ]
+
+    if inconsistencies:
+        # Count all severities in one pass rather than one scan per property
+        severity_counts = Counter(inc.severity for inc in inconsistencies)
+        lines.append(f"    - High Priority: {severity_counts['high']}")
+        lines.append(f"    - Medium Priority: {severity_counts['medium']}")
+        lines.append(f"    - Low Priority: {severity_counts['low']}")
+
+    if consistency_score >= 0.9:
+        lines.append("  🎉 Excellent consistency!")
+    elif consistency_score >= 0.7:
+        lines.append("  👍 Good consistency with room for improvement")
     else:
-        print("  ⚠️  Significant inconsistencies detected")
+        lines.append("  ⚠️  Significant inconsistencies detected")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _run_create_config(args: argparse.Namespace) -> int:
+    """Create the default configuration file."""
+    config_manager = ConfigManager(args.config)
+    config_manager.create_default_config(force=False)
+    print(f"✅ Default configuration created at: {config_manager.config_path}")
+    return 0
+
+
+def _run_setup(args: argparse.Namespace) -> int:
+    """Run setup mode with the configured settings."""
+    return handle_setup_mode(ConfigManager(args.config))
+
+
+def _run_audit(args: argparse.Namespace) -> int:
+    """Run audit mode with the configured settings."""
+    # Validate threshold before loading configuration; only audits use it
+    if not 0.0 <= args.threshold <= 1.0:
+        print("❌ Threshold must be between 0.0 and 1.0")
+        return 1
+
+    return handle_audit_mode(ConfigManager(args.config), args)
+
+
+MODE_HANDLERS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    'create_config': _run_create_config,
+    'setup': _run_setup,
+    'audit': _run_audit,
+}
 
 
 def main(argv: Optional[list] = None) -> int:
@@ -798,28 +954,11 @@ def main(argv: Optional[list] = None) -> int:
 
     logger.info("PARA Auditor starting")
 
-    try:
-        # Handle create-config mode
-        if args.create_config:
-            config_manager = ConfigManager(args.config)
-            config_manager.create_default_config(force=False)
-            print(f"✅ Default configuration created at: {config_manager.config_path}")
-            return 0
-
-        # Validate threshold
-        if not 0.0 <= args.threshold <= 1.0:
-            print("❌ Threshold must be between 0.0 and 1.0")
-            return 1
+    # --create-config takes precedence over the selected mode
+    mode = 'create_config' if args.create_config else args.mode
 
-        # Initialize config manager
-        config_manager = ConfigManager(args.config)
-
-        # Handle different modes
-        if args.setup:
-            return handle_setup_mode(config_manager)
-        else:
-            # Default to audit mode
-            return handle_audit_mode(config_manager, args)
+    try:
+        return MODE_HANDLERS[mode](args)
 
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
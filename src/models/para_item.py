@@ -2,8 +2,146 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
+import bisect
 import re
+import sys
+
+try:
+    from rapidfuzz.distance import JaroWinkler
+except ImportError:  # rapidfuzz is an optional speedup
+    JaroWinkler = None
+
+
+# Precompiled patterns used by PARAItem.normalize_name
+_NAME_STRIP_RE = re.compile(r'[^\w\s\U00010000-\U0010ffff]', re.UNICODE)
+_WS_RE = re.compile(r'\s+')
+
+# Unicode ranges for emojis, sorted by start so they can be searched with bisect
+_EMOJI_RANGES = tuple(sorted([
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
+    (0x1F680, 0x1F6FF),  # Transport and Map
+    (0x1F1E0, 0x1F1FF),  # Regional indicators
+    (0x2600, 0x26FF),    # Misc symbols
+    (0x2700, 0x27BF),    # Dingbats
+    (0xFE00, 0xFE0F),    # Variation Selectors
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+]))
+_EMOJI_STARTS = tuple(start for start, _ in _EMOJI_RANGES)
+
+# Leading run of emoji characters, which may be separated by whitespace
+_EMOJI_CLASS = '[' + ''.join(f'{chr(start)}-{chr(end)}' for start, end in _EMOJI_RANGES) + ']'
+_EMOJI_PREFIX_RE = re.compile(rf'{_EMOJI_CLASS}(?:\s*{_EMOJI_CLASS})*')
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _is_emoji_char(char: str) -> bool:
+    """Check if a single character falls within one of the emoji ranges."""
+    char_code = ord(char)
+    index = bisect.bisect_right(_EMOJI_STARTS, char_code) - 1
+    return index >= 0 and char_code <= _EMOJI_RANGES[index][1]
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Normalize item name for comparison.
+
+    Results are cached because the same names recur across sources and
+    are normalized again on every name comparison.
+    """
+    if not name:
+        return ""
+    
+    # Remove leading/trailing whitespace
+    normalized = name.strip()
+    
+    # Convert to lowercase for comparison
+    normalized = normalized.lower()
+    
+    # Remove special characters except letters, numbers, spaces, and emojis
+    # Keep emojis by preserving Unicode characters
+    normalized = _NAME_STRIP_RE.sub('', normalized)
+    
+    # Replace multiple spaces with single space
+    normalized = _WS_RE.sub(' ', normalized)
+    
+    return normalized.strip()
+
+
+def _jaro_winkler_similarity(name1: str, name2: str) -> float:
+    """Pure-Python Jaro-Winkler similarity, used when rapidfuzz is unavailable.
+
+    Mirrors ``rapidfuzz.distance.JaroWinkler.normalized_similarity`` with the
+    default prefix weight of 0.1.
+    """
+    len1, len2 = len(name1), len(name2)
+    if not len1 and not len2:
+        return 1.0
+    if not len1 or not len2:
+        return 0.0
+
+    # Find matching characters within the sliding window
+    window = max(max(len1, len2) // 2 - 1, 0)
+    matched1 = [False] * len1
+    matched2 = [False] * len2
+    matches = 0
+    for i, char in enumerate(name1):
+        for j in range(max(0, i - window), min(len2, i + window + 1)):
+            if not matched2[j] and name2[j] == char:
+                matched1[i] = matched2[j] = True
+                matches += 1
+                break
+
+    if not matches:
+        return 0.0
+
+    # Count transpositions between the matched characters
+    transpositions = 0
+    j = 0
+    for i in range(len1):
+        if matched1[i]:
+            while not matched2[j]:
+                j += 1
+            if name1[i] != name2[j]:
+                transpositions += 1
+            j += 1
+
+    similarity = (matches / len1 + matches / len2
+                  + (matches - transpositions // 2) / matches) / 3
+
+    return _winkler_boost(similarity, _common_prefix_length(name1, name2))
+
+
+def _common_prefix_length(name1: str, name2: str) -> int:
+    """Length of the common prefix of two names, capped at four characters."""
+    prefix = 0
+    for char1, char2 in zip(name1[:4], name2[:4]):
+        if char1 != char2:
+            break
+        prefix += 1
+    return prefix
+
+
+def _winkler_boost(jaro: float, prefix: int) -> float:
+    """Apply the Winkler common-prefix boost to a Jaro similarity."""
+    if jaro > 0.7:
+        return jaro + prefix * 0.1 * (1.0 - jaro)
+    return jaro
+
+
+def _jaro_winkler_upper_bound(name1: str, name2: str) -> float:
+    """Upper bound on the Jaro-Winkler similarity from lengths and prefix alone.
+
+    At most ``min(len)`` characters can match, which caps the Jaro score at
+    ``(2 + min(len) / max(len)) / 3`` before the prefix boost is applied.
+    """
+    len1, len2 = len(name1), len(name2)
+    max_jaro = (2 + min(len1, len2) / max(len1, len2)) / 3
+    return _winkler_boost(max_jaro, _common_prefix_length(name1, name2))
 
 
 class ItemType(Enum):
@@ -26,7 +164,7 @@ class CategoryType(Enum):
     PERSONAL = "personal"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PARAItem:
     """Represents a PARA method item (Project or Area) from any source."""
     
@@ -71,23 +209,7 @@ class PARAItem:
     @staticmethod
     def normalize_name(name: str) -> str:
         """Normalize item name for comparison."""
-        if not name:
-            return ""
-            
-        # Remove leading/trailing whitespace
-        normalized = name.strip()
-        
-        # Convert to lowercase for comparison
-        normalized = normalized.lower()
-        
-        # Remove special characters except letters, numbers, spaces, and emojis
-        # Keep emojis by preserving Unicode characters
-        normalized = re.sub(r'[^\w\s\U00010000-\U0010ffff]', '', normalized, flags=re.UNICODE)
-        
-        # Replace multiple spaces with single space
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        return normalized.strip()
+        return _normalize_name(name)
     
     def has_emoji(self) -> bool:
         """Check if the item name starts with an emoji."""
@@ -95,22 +217,7 @@ class PARAItem:
             return False
             
         # Check if first character is an emoji
-        first_char = self.raw_name[0] if self.raw_name else ""
-        
-        # Unicode ranges for emojis
-        emoji_ranges = [
-            (0x1F600, 0x1F64F),  # Emoticons
-            (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
-            (0x1F680, 0x1F6FF),  # Transport and Map
-            (0x1F1E0, 0x1F1FF),  # Regional indicators
-            (0x2600, 0x26FF),    # Misc symbols
-            (0x2700, 0x27BF),    # Dingbats
-            (0xFE00, 0xFE0F),    # Variation Selectors
-            (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
-        ]
-        
-        char_code = ord(first_char)
-        return any(start <= char_code <= end for start, end in emoji_ranges)
+        return _is_emoji_char(self.raw_name[0])
     
     def get_name_without_emoji(self) -> str:
         """Get the item name without emoji prefix."""
@@ -118,30 +225,11 @@ class PARAItem:
             return ""
             
         # Remove emoji from the beginning and strip whitespace
-        result = self.raw_name
-        while result and len(result) > 0:
-            first_char = result[0]
-            char_code = ord(first_char)
-            
-            # Check if first character is an emoji
-            emoji_ranges = [
-                (0x1F600, 0x1F64F),  # Emoticons
-                (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
-                (0x1F680, 0x1F6FF),  # Transport and Map
-                (0x1F1E0, 0x1F1FF),  # Regional indicators
-                (0x2600, 0x26FF),    # Misc symbols
-                (0x2700, 0x27BF),    # Dingbats
-                (0xFE00, 0xFE0F),    # Variation Selectors
-                (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
-            ]
-            
-            is_emoji = any(start <= char_code <= end for start, end in emoji_ranges)
-            if not is_emoji:
-                break
-                
-            result = result[1:].strip()
+        match = _EMOJI_PREFIX_RE.match(self.raw_name)
+        if not match:
+            return self.raw_name
             
-        return result
+        return self.raw_name[match.end():].strip()
     
     def matches_name(self, other_name: str, threshold: float = 0.8) -> bool:
         """Check if this item's name matches another name within threshold."""
@@ -149,28 +237,27 @@ class PARAItem:
             return False
             
         normalized_other = self.normalize_name(other_name)
-        return self._calculate_similarity(self.name, normalized_other) >= threshold
+        return self._calculate_similarity(self.name, normalized_other, threshold) >= threshold
     
-    def _calculate_similarity(self, name1: str, name2: str) -> float:
-        """Calculate similarity between two names using simple string matching."""
+    def _calculate_similarity(self, name1: str, name2: str, threshold: float = 0.0) -> float:
+        """Calculate Jaro-Winkler similarity between two names.
+        
+        Scores below ``threshold`` may be reported as 0.0, which lets pairs
+        that cannot reach it be rejected without comparing characters.
+        """
         if not name1 or not name2:
             return 0.0
             
         if name1 == name2:
             return 1.0
             
-        # Simple substring matching
-        shorter = name1 if len(name1) < len(name2) else name2
-        longer = name2 if len(name1) < len(name2) else name1
-        
-        if shorter in longer:
-            return len(shorter) / len(longer)
-            
-        # Character-based similarity
-        matches = sum(1 for c1, c2 in zip(name1, name2) if c1 == c2)
-        max_length = max(len(name1), len(name2))
+        if JaroWinkler is not None:
+            return JaroWinkler.normalized_similarity(name1, name2, score_cutoff=threshold)
         
-        return matches / max_length if max_length > 0 else 0.0
+        # Skip pairs whose lengths and prefix rule out reaching the threshold
+        if _jaro_winkler_upper_bound(name1, name2) < threshold:
+            return 0.0
+        return _jaro_winkler_similarity(name1, name2)
     
     def is_consistent_with(self, other: 'PARAItem') -> bool:
         """Check if this item is consistent with another item."""
@@ -206,7 +293,16 @@ class PARAItem:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PARAItem':
-        """Create PARAItem from dictionary."""
+        """Create PARAItem from dictionary.
+        
+        Dictionaries marked with ``"__trusted__": True`` must come from
+        ``to_dict`` output written by this tool (e.g. a local cache). Their
+        names are already normalized, so normalization and validation are
+        skipped for them.
+        """
+        if data.get("__trusted__"):
+            return cls._from_trusted_dict(data)
+            
         return cls(
             name=data["name"],
             type=ItemType(data["type"]),
@@ -217,6 +313,51 @@ class PARAItem:
             metadata=data.get("metadata")
         )
     
+    @classmethod
+    def _from_trusted_dict(cls, data: Dict[str, Any]) -> 'PARAItem':
+        """Rebuild a PARAItem from trusted ``to_dict`` output without validation."""
+        item = cls.__new__(cls)
+        item.name = data["name"]
+        item.type = ItemType(data["type"])
+        item.is_active = data["is_active"]
+        item.category = CategoryType(data["category"])
+        item.source = ItemSource(data["source"])
+        item.raw_name = data.get("raw_name") or item.name
+        item.metadata = data.get("metadata") or {}
+        return item
+    
+    @classmethod
+    def bulk_create(cls, rows: List[Dict[str, Any]]) -> List['PARAItem']:
+        """Create PARAItems from a list of constructor keyword dictionaries.
+        
+        Each distinct name is normalized once for the whole batch and the
+        items are built without normalizing again, so connectors that build
+        items from API listings should prefer this over constructing items
+        one at a time.
+        """
+        normalized_names = {row["name"]: _normalize_name(row["name"]) for row in rows}
+        
+        return [cls._from_normalized(row, normalized_names[row["name"]]) for row in rows]
+    
+    @classmethod
+    def _from_normalized(cls, row: Dict[str, Any], name: str) -> 'PARAItem':
+        """Build a PARAItem from constructor keywords and an already normalized name.
+        
+        Mirrors ``__post_init__`` apart from normalizing the name.
+        """
+        item = cls.__new__(cls)
+        item.name = name
+        item.type = row["type"]
+        item.is_active = row["is_active"]
+        item.category = row["category"]
+        item.source = row["source"]
+        raw_name = row.get("raw_name")
+        item.raw_name = row["name"] if raw_name is None else raw_name
+        metadata = row.get("metadata")
+        item.metadata = {} if metadata is None else metadata
+        item._validate()
+        return item
+    
     def __str__(self) -> str:
         """String representation of PARAItem."""
         emoji_status = "📱" if self.has_emoji() else "❌"
@@ -241,5 +382,9 @@ class PARAItem:
                 self.category == other.category)
     
     def __hash__(self) -> int:
-        """Hash based on normalized name, source, and category."""
-        return hash((self.name, self.source, self.category))
\ No newline at end of file
+        """Hash based on normalized name, source, and category.
+        
+        The enum values are hashed rather than the members themselves,
+        since str hashes are cached while Enum.__hash__ runs Python code.
+        """
+        return hash((self.name, self.source._value_, self.category._value_))
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""On-disk cache of collected PARA items between audit runs."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+from ..models.para_item import PARAItem
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'para-auditor' / 'items.json'
+
+# Bump when the cached item layout changes so stale files are ignored
+CACHE_VERSION = 1
+
+
+class ItemCache:
+    """JSON cache of collected items, tied to the configuration that produced them."""
+
+    def __init__(self, ttl: float, cache_path: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            ttl: Maximum age in seconds of a cache file that may be reused
+            cache_path: Location of the cache file (defaults to ~/.cache/para-auditor/items.json)
+        """
+        self.ttl = ttl
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+
+    @staticmethod
+    def config_key(config_data: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> str:
+        """Build a content hash identifying the configuration used for collection.
+
+        Args:
+            config_data: Loaded configuration, including environment overrides
+            options: Command-line options that change what is collected
+
+        Returns:
+            Hex digest that changes whenever the configuration changes
+        """
+        content = json.dumps(
+            {'config': config_data, 'options': options or {}},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def load(self, config_key: str) -> Optional[List[PARAItem]]:
+        """Load cached items if the cache is fresh and matches the configuration.
+
+        Args:
+            config_key: Key returned by ``config_key`` for the current run
+
+        Returns:
+            Cached items, or None if there is no usable cache
+        """
+        try:
+            age = time.time() - self.cache_path.stat().st_mtime
+        except OSError:
+            return None
+
+        if age > self.ttl:
+            logger.debug(f"Item cache is {age:.0f}s old, ignoring")
+            return None
+
+        try:
+            data = self.cache_path.read_bytes()
+            payload = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read item cache {self.cache_path}: {e}")
+            return None
+
+        if not isinstance(payload, dict):
+            logger.warning(f"Ignoring malformed item cache {self.cache_path}: expected a JSON object")
+            return None
+
+        if payload.get('version') != CACHE_VERSION or payload.get('config_key') != config_key:
+            logger.debug("Item cache was written for a different configuration, ignoring")
+            return None
+
+        try:
+            items = [
+                PARAItem.from_dict({**item_data, '__trusted__': True})
+                for item_data in payload['items']
+            ]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed item cache {self.cache_path}: {e}")
+            return None
+
+        logger.info(f"Loaded {len(items)} items from cache {self.cache_path}")
+        return items
+
+    def save(self, config_key: str, items: List[PARAItem]) -> None:
+        """Write items to the cache atomically.
+
+        Failures are logged rather than raised, since the cache is only an
+        optimization.
+
+        Args:
+            config_key: Key returned by ``config_key`` for the current run
+            items: Items collected from all sources
+        """
+        payload = {
+            'version': CACHE_VERSION,
+            'config_key': config_key,
+            'items': [item.to_dict() for item in items]
+        }
+
+        try:
+            if orjson is not None:
+                data = orjson.dumps(payload, default=str)
+            else:
+                data = json.dumps(payload, default=str, ensure_ascii=False).encode('utf-8')
+
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write item cache {self.cache_path}: {e}")
+            return
+
+        logger.debug(f"Saved {len(items)} items to cache {self.cache_path}")
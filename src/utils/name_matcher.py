@@ -1,13 +1,96 @@
 """Name matching utilities for fuzzy string comparison and normalization."""
+import heapq
 import re
+import sys
 import logging
-from typing import List, Dict, Tuple, Optional
-from difflib import SequenceMatcher
+from collections import Counter
+from dataclasses import dataclass
+from itertools import combinations
+from typing import List, Dict, FrozenSet, Set, Tuple, Optional
 import unicodedata
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Unicode ranges for emojis
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F1E0, 0x1F1FF),  # flags (iOS)
+    (0x2600, 0x26FF),    # miscellaneous symbols
+    (0x2700, 0x27BF),    # dingbats
+    (0x1F900, 0x1F9FF),  # supplemental symbols and pictographs
+    (0x1F018, 0x1F0F5),  # mahjong tiles
+    (0x1F000, 0x1F02F),  # playing cards
+)
+_EMOJI_RE = re.compile(
+    '[' + ''.join(f'{chr(start)}-{chr(end)}' for start, end in _EMOJI_RANGES) + ']+',
+    flags=re.UNICODE
+)
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
+
+if sys.version_info >= (3, 10):
+    def _popcount(value: int) -> int:
+        """Number of set bits in a non-negative integer."""
+        return value.bit_count()
+else:
+    def _popcount(value: int) -> int:
+        """Number of set bits in a non-negative integer."""
+        return bin(value).count('1')
+
+
+def _bitmap_jaccard(bits1: int, bits2: int) -> float:
+    """Jaccard similarity of two sets encoded as bitmaps, or 0.0 if either is empty."""
+    if not bits1 or not bits2:
+        return 0.0
+    return _popcount(bits1 & bits2) / _popcount(bits1 | bits2)
+
+
+def _jaccard(set1: FrozenSet[str], set2: FrozenSet[str]) -> float:
+    """Jaccard similarity of two sets, or 0.0 if either is empty."""
+    if not set1 or not set2:
+        return 0.0
+    
+    # Derive the union size from the intersection instead of building it
+    intersection = len(set1 & set2)
+    return intersection / (len(set1) + len(set2) - intersection)
+
+
+def _longest_common_substring(name1: str, name2: str) -> int:
+    """Length of the longest common substring of two strings.
+    
+    Binary searches the length, since a common substring of length k
+    implies one of every shorter length. Each probe compares sets of
+    slices, which keeps the per-character work in C rather than in a
+    Python dynamic programming loop.
+    """
+    shorter, longer = (name1, name2) if len(name1) <= len(name2) else (name2, name1)
+    if shorter in longer:
+        return len(shorter)
+    
+    # The answer lies in [low, high]; the full shorter string was ruled out
+    low, high = 0, len(shorter) - 1
+    while low < high:
+        length = (low + high + 1) // 2
+        substrings = {shorter[i:i + length] for i in range(len(shorter) - length + 1)}
+        if substrings.isdisjoint([longer[i:i + length] for i in range(len(longer) - length + 1)]):
+            high = length - 1
+        else:
+            low = length
+    return low
+
+
+@dataclass(frozen=True)
+class NormalizedName:
+    """A normalized name together with the forms used for similarity scoring."""
+    norm: str
+    words: FrozenSet[str]  # Words of norm, excluding stop words
+    word_bits: int  # Bitmap of words by their per-matcher word id
+    ngrams: FrozenSet[str]  # Character trigrams of norm
+    length: int
+
 
 class NameMatcher:
     """Utility for fuzzy name matching and normalization."""
@@ -23,12 +106,12 @@ class NameMatcher:
         self.emoji_aware = emoji_aware
         
         # Common words to ignore in matching
-        self.stop_words = {
+        self.stop_words = frozenset({
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
             'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
             'before', 'after', 'above', 'below', 'between', 'among', 'along',
             'project', 'area', 'folder', 'task', 'item'
-        }
+        })
         
         # Common abbreviations and their expansions
         self.abbreviations = {
@@ -49,10 +132,25 @@ class NameMatcher:
             'sales': 'sales',
             'eng': 'engineering'
         }
+        
+        # Normalized names keyed by the original name
+        self._normalized_cache: Dict[str, str] = {}
+        
+        # Character n-gram sets keyed by (n, normalized name)
+        self._ngram_cache: Dict[Tuple[int, str], FrozenSet[str]] = {}
+        
+        # Prepared forms keyed by normalized name
+        self._prepared_cache: Dict[str, NormalizedName] = {}
+        
+        # Bit positions for word bitmaps, assigned as words are first seen
+        self._word_ids: Dict[str, int] = {}
     
     def normalize_name(self, name: str) -> str:
         """Normalize a name for comparison.
         
+        Results are cached per instance, since the same names are compared
+        against each other many times when grouping.
+        
         Args:
             name: Name to normalize
             
@@ -62,33 +160,41 @@ class NameMatcher:
         if not name:
             return ""
         
+        normalized = self._normalized_cache.get(name)
+        if normalized is None:
+            normalized = self._normalize_uncached(name)
+            self._normalized_cache[name] = normalized
+        return normalized
+    
+    def _normalize_uncached(self, name: str) -> str:
+        """Normalize a name without consulting the cache.
+        
+        Args:
+            name: Non-empty name to normalize
+            
+        Returns:
+            Normalized name
+        """
         # Remove emoji if emoji_aware is enabled
         if self.emoji_aware:
             name = self._remove_emoji(name)
         
-        # Convert to lowercase
-        normalized = name.lower().strip()
-        
         # Remove unicode accents and special characters
-        normalized = unicodedata.normalize('NFKD', normalized)
+        normalized = unicodedata.normalize('NFKD', name)
         normalized = ''.join(c for c in normalized if not unicodedata.combining(c))
         
+        # Convert to lowercase once accents have been split off
+        normalized = normalized.lower().strip()
+        
         # Remove special characters except letters, numbers, and spaces
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
+        normalized = _NON_WORD_RE.sub(' ', normalized)
         
         # Replace multiple spaces with single space
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = _WS_RE.sub(' ', normalized).strip()
         
         # Expand abbreviations
-        words = normalized.split()
-        expanded_words = []
-        for word in words:
-            if word in self.abbreviations:
-                expanded_words.append(self.abbreviations[word])
-            else:
-                expanded_words.append(word)
-        
-        return ' '.join(expanded_words)
+        abbreviations = self.abbreviations
+        return ' '.join([abbreviations.get(word, word) for word in normalized.split()])
     
     def _remove_emoji(self, text: str) -> str:
         """Remove emoji characters from text.
@@ -102,22 +208,55 @@ class NameMatcher:
         if not text:
             return ""
         
-        # Unicode ranges for emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002600-\U000026FF"  # miscellaneous symbols
-            "\U00002700-\U000027BF"  # dingbats
-            "\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
-            "\U0001F018-\U0001F0F5"  # mahjong tiles
-            "\U0001F000-\U0001F02F"  # playing cards
-            "]+", flags=re.UNICODE
-        )
+        # Every emoji range lies outside ASCII, so plain names skip the regex
+        if text.isascii():
+            return text.strip()
+        
+        return _EMOJI_RE.sub('', text).strip()
+    
+    def prepare(self, name: str) -> NormalizedName:
+        """Normalize a name and precompute the forms used to compare it.
         
-        return emoji_pattern.sub('', text).strip()
+        Preparing each name once lets batch operations compare many pairs
+        without repeating normalization or set construction.
+        
+        Args:
+            name: Name to prepare
+            
+        Returns:
+            Prepared name
+        """
+        norm = self.normalize_name(name) if name else ""
+        return self._prepare_normalized(norm)
+    
+    def _prepare_normalized(self, norm: str) -> NormalizedName:
+        """Prepare an already normalized name, cached per instance.
+        
+        Args:
+            norm: Normalized name
+            
+        Returns:
+            Prepared name
+        """
+        prepared = self._prepared_cache.get(norm)
+        if prepared is None:
+            stop_words = self.stop_words
+            words = frozenset(word for word in norm.split() if word not in stop_words)
+            
+            word_ids = self._word_ids
+            word_bits = 0
+            for word in words:
+                word_bits |= 1 << word_ids.setdefault(word, len(word_ids))
+            
+            prepared = NormalizedName(
+                norm=norm,
+                words=words,
+                word_bits=word_bits,
+                ngrams=self._get_ngrams(norm, 3),
+                length=len(norm)
+            )
+            self._prepared_cache[norm] = prepared
+        return prepared
     
     def calculate_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity between two names.
@@ -132,10 +271,22 @@ class NameMatcher:
         if not name1 or not name2:
             return 0.0
         
-        # Normalize names
-        norm1 = self.normalize_name(name1)
-        norm2 = self.normalize_name(name2)
+        return self._similarity(self.prepare(name1), self.prepare(name2))
+    
+    def _similarity(self, name1: NormalizedName, name2: NormalizedName,
+                    cutoff: float = 0.0) -> float:
+        """Calculate similarity between two prepared names.
         
+        Args:
+            name1: First prepared name
+            name2: Second prepared name
+            cutoff: Score the caller needs to reach; pairs that cannot reach
+                it may return a lower, inexact score (0.0 computes exactly)
+            
+        Returns:
+            Similarity score between 0.0 and 1.0
+        """
+        norm1, norm2 = name1.norm, name2.norm
         if not norm1 or not norm2:
             return 0.0
         
@@ -143,27 +294,35 @@ class NameMatcher:
         if norm1 == norm2:
             return 1.0
         
-        # Use multiple similarity metrics and take the maximum
-        similarities = []
+        # Use multiple similarity metrics and take the maximum, starting
+        # with the cheaper word and n-gram metrics
         
-        # 1. Sequence matcher (overall similarity)
-        seq_sim = SequenceMatcher(None, norm1, norm2).ratio()
-        similarities.append(seq_sim)
+        # 1. Word-based similarity
+        best = _bitmap_jaccard(name1.word_bits, name2.word_bits)
         
-        # 2. Word-based similarity
-        word_sim = self._calculate_word_similarity(norm1, norm2)
-        similarities.append(word_sim)
+        # 2. Character n-gram similarity
+        best = max(best, _jaccard(name1.ngrams, name2.ngrams))
         
-        # 3. Substring similarity
-        substr_sim = self._calculate_substring_similarity(norm1, norm2)
-        similarities.append(substr_sim)
-        
-        # 4. Character n-gram similarity
-        ngram_sim = self._calculate_ngram_similarity(norm1, norm2, n=3)
-        similarities.append(ngram_sim)
+        # The substring and sequence metrics can never exceed the length
+        # ratio bound, so skip them when it cannot raise the score enough
+        len1, len2 = name1.length, name2.length
+        length_bound = 2 * min(len1, len2) / (len1 + len2)
+        if length_bound <= best or length_bound < cutoff:
+            return best
         
-        # Return the maximum similarity score
-        return max(similarities)
+        # 3. Substring similarity
+        best = max(best, self._calculate_substring_similarity(norm1, norm2))
+        
+        # 4. Sequence matcher (overall similarity); its cheap upper bound
+        # skips the full comparison when it cannot beat the best score.
+        # difflib is imported here since most pairs never get this far.
+        from difflib import SequenceMatcher
+        matcher = SequenceMatcher(None, norm1, norm2)
+        quick_bound = matcher.quick_ratio()
+        if quick_bound > best and quick_bound >= cutoff:
+            best = max(best, matcher.ratio())
+        
+        return best
     
     def _calculate_word_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity based on word overlap.
@@ -175,20 +334,12 @@ class NameMatcher:
         Returns:
             Word-based similarity score
         """
-        words1 = set(word for word in name1.split() if word not in self.stop_words)
-        words2 = set(word for word in name2.split() if word not in self.stop_words)
-        
-        if not words1 or not words2:
-            return 0.0
+        stop_words = self.stop_words
+        words1 = {word for word in name1.split() if word not in stop_words}
+        words2 = {word for word in name2.split() if word not in stop_words}
         
         # Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        if union == 0:
-            return 0.0
-        
-        return intersection / union
+        return _jaccard(words1, words2)
     
     def _calculate_substring_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity based on longest common substring.
@@ -203,20 +354,7 @@ class NameMatcher:
         if not name1 or not name2:
             return 0.0
         
-        # Find longest common substring
-        m, n = len(name1), len(name2)
-        longest = 0
-        
-        # Create a table to store lengths of longest common substrings
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if name1[i-1] == name2[j-1]:
-                    dp[i][j] = dp[i-1][j-1] + 1
-                    longest = max(longest, dp[i][j])
-                else:
-                    dp[i][j] = 0
+        longest = _longest_common_substring(name1, name2)
         
         # Return ratio of longest common substring to average length
         avg_length = (len(name1) + len(name2)) / 2
@@ -236,18 +374,25 @@ class NameMatcher:
         if not name1 or not name2:
             return 0.0
         
-        # Generate n-grams
-        ngrams1 = set(name1[i:i+n] for i in range(len(name1) - n + 1))
-        ngrams2 = set(name2[i:i+n] for i in range(len(name2) - n + 1))
-        
-        if not ngrams1 or not ngrams2:
-            return 0.0
-        
         # Jaccard similarity for n-grams
-        intersection = len(ngrams1.intersection(ngrams2))
-        union = len(ngrams1.union(ngrams2))
+        return _jaccard(self._get_ngrams(name1, n), self._get_ngrams(name2, n))
+    
+    def _get_ngrams(self, name: str, n: int) -> FrozenSet[str]:
+        """Get the set of character n-grams of a name, cached per instance.
         
-        return intersection / union if union > 0 else 0.0
+        Args:
+            name: Normalized name
+            n: Size of n-grams
+            
+        Returns:
+            Set of n-grams (empty if the name is shorter than n)
+        """
+        key = (n, name)
+        ngrams = self._ngram_cache.get(key)
+        if ngrams is None:
+            ngrams = frozenset(name[i:i+n] for i in range(len(name) - n + 1))
+            self._ngram_cache[key] = ngrams
+        return ngrams
     
     def is_match(self, name1: str, name2: str, threshold: Optional[float] = None) -> bool:
         """Check if two names match within the similarity threshold.
@@ -263,7 +408,7 @@ class NameMatcher:
         if threshold is None:
             threshold = self.similarity_threshold
         
-        similarity = self.calculate_similarity(name1, name2)
+        similarity = self._similarity(self.prepare(name1), self.prepare(name2), threshold)
         return similarity >= threshold
     
     def find_best_matches(self, target_name: str, candidate_names: List[str], 
@@ -281,49 +426,136 @@ class NameMatcher:
         if not target_name or not candidate_names:
             return []
         
+        target = self.prepare(target_name)
+        
+        # Candidates that normalize to the same string share one score
+        scores: Dict[str, float] = {}
+        
         matches = []
         for candidate in candidate_names:
-            similarity = self.calculate_similarity(target_name, candidate)
+            prepared = self.prepare(candidate)
+            similarity = scores.get(prepared.norm)
+            if similarity is None:
+                similarity = self._similarity(target, prepared, self.similarity_threshold)
+                scores[prepared.norm] = similarity
             if similarity >= self.similarity_threshold:
                 matches.append((candidate, similarity))
         
-        # Sort by similarity score (descending) and return top matches
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[:max_matches]
+        # Select the top matches by similarity score (descending, stable)
+        return heapq.nlargest(max_matches, matches, key=lambda x: x[1])
     
     def group_similar_names(self, names: List[str]) -> List[List[str]]:
         """Group similar names together.
         
+        Groups are the connected components of the "matches" relation, so a
+        name joins a group when it matches any member. To avoid scoring
+        every pair, only pairs that could reach the threshold are compared
+        (see _candidate_pairs), so the grouping matches scoring all pairs.
+        
         Args:
             names: List of names to group
             
         Returns:
-            List of groups, where each group contains similar names
+            List of groups, where each group contains similar names in
+            order of first appearance
         """
         if not names:
             return []
         
-        groups = []
-        processed = set()
+        # Each distinct name is grouped once
+        unique_names = list(dict.fromkeys(names))
         
-        for name in names:
-            if name in processed:
+        if self.similarity_threshold <= 0:
+            # Every pair matches, so all names form a single group
+            return [unique_names]
+        
+        prepared = [self.prepare(name) for name in unique_names]
+        
+        # Union-find over name indices; roots are always the lowest index
+        parent = list(range(len(unique_names)))
+        
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+        
+        for i, j in self._candidate_pairs(prepared):
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
                 continue
             
-            # Start a new group with this name
-            current_group = [name]
-            processed.add(name)
-            
-            # Find all similar names
-            for other_name in names:
-                if other_name != name and other_name not in processed:
-                    if self.is_match(name, other_name):
-                        current_group.append(other_name)
-                        processed.add(other_name)
+            similarity = self._similarity(prepared[i], prepared[j], self.similarity_threshold)
+            if similarity >= self.similarity_threshold:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        groups: Dict[int, List[str]] = {}
+        for index, name in enumerate(unique_names):
+            groups.setdefault(find(index), []).append(name)
+        
+        return list(groups.values())
+    
+    def _candidate_pairs(self, prepared: List[NormalizedName]) -> List[Tuple[int, int]]:
+        """Find every pair of names that could reach the similarity threshold.
+        
+        The word and trigram scores are only non-zero for names sharing a
+        significant word or a trigram, which an inverted index finds. The
+        substring and sequence scores never exceed 2*C/(len1 + len2), where
+        C is the number of characters the names have in common, so any
+        other pair is kept only when that bound reaches the threshold.
+        
+        Args:
+            prepared: Prepared names
             
-            groups.append(current_group)
+        Returns:
+            Sorted (i, j) index pairs with i < j
+        """
+        index: Dict[object, List[int]] = {}
         
-        return groups
+        for i, name in enumerate(prepared):
+            if not name.norm:
+                continue
+            
+            keys: Set[object] = set(name.ngrams)
+            keys.update(('word', word) for word in name.words)
+            for key in keys:
+                index.setdefault(key, []).append(i)
+        
+        pairs = set()
+        for bucket in index.values():
+            pairs.update(combinations(bucket, 2))
+        
+        # The bound also caps C at the shorter length, so names sorted by
+        # length only need comparing until 2*len1/(len1 + len2) drops below
+        # the threshold; the small slack absorbs float rounding
+        cutoff = self.similarity_threshold - 1e-9
+        by_length = sorted(
+            (i for i, name in enumerate(prepared) if name.norm),
+            key=lambda i: prepared[i].length
+        )
+        char_counts: Dict[int, Counter] = {}
+        
+        for position, i in enumerate(by_length):
+            length_i = prepared[i].length
+            for j in by_length[position + 1:]:
+                length_j = prepared[j].length
+                total = length_i + length_j
+                if 2 * length_i < cutoff * total:
+                    break
+                
+                pair = (min(i, j), max(i, j))
+                if pair in pairs:
+                    continue
+                
+                if i not in char_counts:
+                    char_counts[i] = Counter(prepared[i].norm)
+                if j not in char_counts:
+                    char_counts[j] = Counter(prepared[j].norm)
+                common = sum((char_counts[i] & char_counts[j]).values())
+                if 2 * common >= cutoff * total:
+                    pairs.add(pair)
+        
+        return sorted(pairs)
     
     def suggest_canonical_name(self, names: List[str]) -> str:
         """Suggest a canonical name from a group of similar names.
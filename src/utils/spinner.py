@@ -1,7 +1,6 @@
 """Simple ASCII spinner animation utility."""
 
 import sys
-import time
 import threading
 from contextlib import contextmanager
 
@@ -14,10 +13,12 @@ class Spinner:
         self.frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.running = False
         self.thread = None
+        self._stop_event = threading.Event()
     
     def start(self):
         """Start the spinner animation."""
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._animate)
         self.thread.daemon = True
         self.thread.start()
@@ -25,20 +26,22 @@ class Spinner:
     def stop(self):
         """Stop the spinner and clear the line."""
         self.running = False
+        self._stop_event.set()
         if self.thread:
-            self.thread.join(timeout=0.1)
+            self.thread.join()
         # Clear the line
         sys.stdout.write('\r' + ' ' * (len(self.message) + 10) + '\r')
         sys.stdout.flush()
     
     def _animate(self):
         """Internal animation loop."""
+        lines = [f'\r{frame} {self.message}...' for frame in self.frames]
         frame_index = 0
-        while self.running:
-            frame = self.frames[frame_index % len(self.frames)]
-            sys.stdout.write(f'\r{frame} {self.message}...')
+        while not self._stop_event.is_set():
+            sys.stdout.write(lines[frame_index % len(lines)])
             sys.stdout.flush()
-            time.sleep(0.1)
+            # Wake immediately when stopped instead of sleeping out the frame
+            self._stop_event.wait(0.1)
             frame_index += 1
 
 
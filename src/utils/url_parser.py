@@ -4,9 +4,58 @@ import logging
 from typing import Dict, List, Optional, Union
 from urllib.parse import urlparse, parse_qs
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Regex patterns for various Google Drive URL formats, in priority order;
+# each captures the file/folder ID as its only group
+_GDRIVE_PATTERNS = (
+    # Standard folder URLs
+    r'https://drive\.google\.com/drive/folders/([a-zA-Z0-9_-]+)',
+    # User-specific folder URLs
+    r'https://drive\.google\.com/drive/u/\d+/folders/([a-zA-Z0-9_-]+)',
+    # Folder URLs with parameters
+    r'https://drive\.google\.com/drive/folders/([a-zA-Z0-9_-]+)\?[^\s]*',
+    r'https://drive\.google\.com/drive/u/\d+/folders/([a-zA-Z0-9_-]+)\?[^\s]*',
+    # Open URLs
+    r'https://drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
+    # Document URLs (for folder IDs in sharing URLs)
+    r'https://docs\.google\.com/.*?/d/([a-zA-Z0-9_-]+)',
+    # File URLs
+    r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
+    # Alternative file URLs
+    r'https://drive\.google\.com/uc\?id=([a-zA-Z0-9_-]+)',
+)
+
+# All ID patterns as one alternation, so a URL is scanned once; the
+# matching alternative is the last group that participated in the match
+_GDRIVE_ID_RE = re.compile('|'.join(_GDRIVE_PATTERNS), re.IGNORECASE)
+
+# Hosts that serve Google Drive content
+_GOOGLE_DOMAINS = (
+    'drive.google.com',
+    'docs.google.com',
+    'sheets.google.com',
+    'slides.google.com'
+)
+
+# Substrings that mark a URL as a sharing link
+_SHARING_INDICATORS = (
+    'usp=sharing',
+    'usp=drive_link',
+    '/edit?',
+    '/view?',
+    'open?id='
+)
+
+# User index segment in multi-account URLs (e.g. /u/1/)
+_USER_INDEX_RE = re.compile(r'/u/(\d+)/')
+
+# Complete Google Drive/Docs URLs embedded in free text
+_DRIVE_URL_RE = re.compile(
+    r'https://(?:drive|docs|sheets|slides)\.google\.com/[^\s<>"]+',
+    re.IGNORECASE
+)
+
 
 class URLParser:
     """Parser for Google Drive URLs and account classification."""
@@ -22,26 +71,13 @@ class URLParser:
         self.personal_domains = personal_domains or []
         
         # Regex patterns for various Google Drive URL formats
-        self.gdrive_patterns = [
-            # Standard folder URLs
-            r'https://drive\.google\.com/drive/folders/([a-zA-Z0-9_-]+)',
-            # User-specific folder URLs
-            r'https://drive\.google\.com/drive/u/\d+/folders/([a-zA-Z0-9_-]+)',
-            # Folder URLs with parameters
-            r'https://drive\.google\.com/drive/folders/([a-zA-Z0-9_-]+)\?[^\s]*',
-            r'https://drive\.google\.com/drive/u/\d+/folders/([a-zA-Z0-9_-]+)\?[^\s]*',
-            # Open URLs
-            r'https://drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
-            # Document URLs (for folder IDs in sharing URLs)
-            r'https://docs\.google\.com/.*?/d/([a-zA-Z0-9_-]+)',
-            # File URLs
-            r'https://drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
-            # Alternative file URLs
-            r'https://drive\.google\.com/uc\?id=([a-zA-Z0-9_-]+)',
-        ]
+        self.gdrive_patterns = list(_GDRIVE_PATTERNS)
         
         # Compiled regex patterns for better performance
         self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.gdrive_patterns]
+        
+        # Parse results keyed by URL, shared by validate/normalize calls
+        self._parse_cache: Dict[str, Optional[Dict[str, Union[str, bool]]]] = {}
     
     def parse_drive_url(self, url: str) -> Optional[Dict[str, Union[str, bool]]]:
         """Parse a Google Drive URL and extract metadata.
@@ -55,6 +91,24 @@ class URLParser:
         if not url or not isinstance(url, str):
             return None
         
+        if url in self._parse_cache:
+            parsed = self._parse_cache[url]
+        else:
+            parsed = self._parse_drive_url_uncached(url)
+            self._parse_cache[url] = parsed
+        
+        # Hand out a copy so callers cannot modify the cached result
+        return dict(parsed) if parsed is not None else None
+    
+    def _parse_drive_url_uncached(self, url: str) -> Optional[Dict[str, Union[str, bool]]]:
+        """Parse a Google Drive URL without consulting the cache.
+        
+        Args:
+            url: Google Drive URL to parse
+            
+        Returns:
+            Dictionary with parsed URL information or None if invalid
+        """
         url = url.strip()
         if not url.startswith(('http://', 'https://')):
             return None
@@ -66,13 +120,16 @@ class URLParser:
             if not self._is_google_drive_url(parsed_url.netloc):
                 return None
             
+            # Parse the query string once for all helpers
+            query_params = parse_qs(parsed_url.query)
+            
             # Extract folder/file ID
-            file_id = self._extract_id_from_url(url)
+            file_id = self._extract_id_from_url(url, query_params)
             if not file_id:
                 return None
             
             # Determine account type
-            account_type = self._classify_account_type(url, parsed_url)
+            account_type = self._classify_account_type(url, parsed_url, query_params)
             
             # Determine resource type (folder, file, etc.)
             resource_type = self._determine_resource_type(url, parsed_url)
@@ -100,33 +157,28 @@ class URLParser:
         Returns:
             True if it's a Google Drive URL
         """
-        google_domains = [
-            'drive.google.com',
-            'docs.google.com',
-            'sheets.google.com',
-            'slides.google.com'
-        ]
-        
-        return any(domain in netloc.lower() for domain in google_domains)
+        netloc = netloc.lower()
+        return any(domain in netloc for domain in _GOOGLE_DOMAINS)
     
-    def _extract_id_from_url(self, url: str) -> Optional[str]:
+    def _extract_id_from_url(self, url: str,
+                             query_params: Optional[Dict[str, List[str]]] = None) -> Optional[str]:
         """Extract file/folder ID from Google Drive URL.
         
         Args:
             url: Google Drive URL
+            query_params: Already parsed query string of the URL, if available
             
         Returns:
             File/folder ID or None if not found
         """
-        for pattern in self.compiled_patterns:
-            match = pattern.search(url)
-            if match:
-                return match.group(1)
+        match = _GDRIVE_ID_RE.search(url)
+        if match:
+            return match.group(match.lastindex)
         
         # Try to extract from query parameters
         try:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
+            if query_params is None:
+                query_params = parse_qs(urlparse(url).query)
             if 'id' in query_params:
                 return query_params['id'][0]
         except Exception:
@@ -134,26 +186,26 @@ class URLParser:
         
         return None
     
-    def _classify_account_type(self, url: str, parsed_url) -> str:
+    def _classify_account_type(self, url: str, parsed_url,
+                               query_params: Optional[Dict[str, List[str]]] = None) -> str:
         """Classify URL as work or personal account.
         
+        The user index in the URL (u/0, u/1, etc.) is not used: which index
+        belongs to the work or personal account varies between browsers, so
+        only domain hints in the URL parameters are trusted.
+        
         Args:
             url: Original URL
             parsed_url: Parsed URL object
+            query_params: Already parsed query string, if available
             
         Returns:
             'work', 'personal', or 'unknown'
         """
-        # Method 1: Check user index in URL (u/0, u/1, etc.)
-        user_index = self._extract_user_index(url)
-        if user_index is not None:
-            # Typically u/0 is personal, u/1 is work (but this varies)
-            # We'll use domain classification as primary method
-            pass
-        
-        # Method 2: Check for domain hints in URL parameters
+        # Check for domain hints in URL parameters
         try:
-            query_params = parse_qs(parsed_url.query)
+            if query_params is None:
+                query_params = parse_qs(parsed_url.query)
             if 'authuser' in query_params:
                 auth_user = query_params['authuser'][0]
                 # Check if auth_user contains domain information
@@ -166,12 +218,6 @@ class URLParser:
         except Exception:
             pass
         
-        # Method 3: Heuristic based on user index
-        if user_index is not None:
-            # Common pattern: u/0 = primary (often personal), u/1+ = secondary (often work)
-            # But this is not reliable, so we return unknown
-            pass
-        
         return 'unknown'
     
     def _extract_user_index(self, url: str) -> Optional[int]:
@@ -183,7 +229,7 @@ class URLParser:
         Returns:
             User index number or None if not found
         """
-        match = re.search(r'/u/(\d+)/', url)
+        match = _USER_INDEX_RE.search(url)
         if match:
             return int(match.group(1))
         return None
@@ -228,15 +274,7 @@ class URLParser:
         Returns:
             True if it appears to be a sharing URL
         """
-        sharing_indicators = [
-            'usp=sharing',
-            'usp=drive_link',
-            '/edit?',
-            '/view?',
-            'open?id='
-        ]
-        
-        return any(indicator in url for indicator in sharing_indicators)
+        return any(indicator in url for indicator in _SHARING_INDICATORS)
     
     def extract_all_drive_urls(self, text: str) -> List[str]:
         """Extract all Google Drive URLs from a text string.
@@ -250,40 +288,8 @@ class URLParser:
         if not text:
             return []
         
-        urls = []
-        
-        # Use regex to find all potential URLs
-        for pattern in self.compiled_patterns:
-            matches = pattern.findall(text)
-            for match in matches:
-                # Reconstruct the full URL
-                if isinstance(match, tuple):
-                    # Handle grouped matches
-                    for group in match:
-                        if group and group.startswith('https://'):
-                            urls.append(group)
-                            break
-                elif match.startswith('https://'):
-                    urls.append(match)
-        
-        # Also look for complete URLs in text
-        url_pattern = re.compile(
-            r'https://(?:drive|docs|sheets|slides)\.google\.com/[^\s<>"]+',
-            re.IGNORECASE
-        )
-        
-        complete_urls = url_pattern.findall(text)
-        urls.extend(complete_urls)
-        
         # Remove duplicates while preserving order
-        seen = set()
-        unique_urls = []
-        for url in urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
-        
-        return unique_urls
+        return list(dict.fromkeys(_DRIVE_URL_RE.findall(text)))
     
     def normalize_drive_url(self, url: str) -> Optional[str]:
         """Normalize a Google Drive URL to a standard format.
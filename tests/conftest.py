@@ -1,5 +1,8 @@
 """Pytest configuration and common fixtures for PARA Auditor tests."""
 
+import copy
+import types
+
 import pytest
 from unittest.mock import Mock
 from pathlib import Path
@@ -7,10 +10,25 @@ from pathlib import Path
 from src.models.para_item import PARAItem, ItemType, ItemSource, CategoryType
 
 
-@pytest.fixture
-def sample_para_items():
-    """Provide sample PARA items for testing."""
+def _make_inc(inc_type, description, severity, items, suggested_action):
+    """Build an inconsistency dict in the shape used by the sample fixtures."""
     return {
+        'type': inc_type,
+        'description': description,
+        'severity': severity,
+        'items': items,
+        'suggested_action': suggested_action
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_para_items():
+    """Provide sample PARA items for testing.
+
+    Built once per session and shared by every test, so tests must not
+    modify the items.
+    """
+    return types.MappingProxyType({
         'work_project': PARAItem(
             name="Website Redesign",
             raw_name="🌐 Website Redesign",
@@ -95,10 +113,35 @@ def sample_para_items():
                 'project_id': 'area_4'
             }
         )
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def empty_source_matches():
+    """Provide a read-only mapping of every item source to no matching items.
+
+    Tests that add matches should copy it with
+    ``{source: list(items) for source, items in empty_source_matches.items()}``.
+    """
+    return types.MappingProxyType({source: () for source in ItemSource})
+
+
+@pytest.fixture(scope="session")
+def todoist_connector():
+    """Provide one Todoist connector for tests that exercise its local helpers.
+
+    ``requests.Session`` is replaced while the connector is built so no real
+    HTTP client is created.
+    """
+    import requests
+    from src.connectors.todoist_connector import TodoistConnector
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(requests, 'Session', Mock)
+        return TodoistConnector("dummy_token")
+
+
+@pytest.fixture(scope="session")
 def mock_config_manager():
     """Provide a mock configuration manager for testing."""
     config = Mock()
@@ -115,63 +158,68 @@ def mock_config_manager():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_comparison_result():
-    """Provide a mock comparison result for testing."""
-    result = Mock()
-    result.total_items = 6
-    result.consistent_items = 4
-    result.consistency_score = 0.67
-    result.inconsistencies = []
-    result.item_groups = []
-    result.high_severity_count = 0
-    result.medium_severity_count = 0
-    result.low_severity_count = 0
-    return result
-
-
-@pytest.fixture
+    """Provide a stand-in comparison result for testing."""
+    return types.SimpleNamespace(
+        total_items=6,
+        consistent_items=4,
+        consistency_score=0.67,
+        inconsistencies=[],
+        item_groups=[],
+        orphaned_items=[],
+        high_severity_count=0,
+        medium_severity_count=0,
+        low_severity_count=0
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_report_metadata():
-    """Provide mock report metadata for testing."""
-    metadata = Mock()
-    metadata.generated_at = "2024-01-01 12:00:00"
-    metadata.total_items = 6
-    metadata.consistency_score = 0.67
-    metadata.sources_audited = ["Todoist", "Google Drive", "Apple Notes"]
-    metadata.filters_applied = {}
-    metadata.version = "1.0"
-    return metadata
-
-
-@pytest.fixture
+    """Provide stand-in report metadata for testing."""
+    return types.SimpleNamespace(
+        generated_at="2024-01-01 12:00:00",
+        total_items=6,
+        consistency_score=0.67,
+        sources_audited=["Todoist", "Google Drive", "Apple Notes"],
+        filters_applied={},
+        version="1.0"
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_inconsistencies():
-    """Provide sample inconsistencies for testing."""
-    return [
-        {
-            'type': 'missing_next_action',
-            'description': "Area 'Evacuation Plan' has no @next actions",
-            'severity': 'medium',
-            'items': ['work_area_without_next'],
-            'suggested_action': "Add at least one task with @next label to define the next action"
-        },
-        {
-            'type': 'status_mismatch',
-            'description': "Status mismatch between Todoist and Google Drive",
-            'severity': 'high',
-            'items': ['work_project'],
-            'suggested_action': "Update status to match across all tools"
-        },
-        {
-            'type': 'missing_item',
-            'description': "Project not found in Google Drive",
-            'severity': 'high',
-            'items': ['personal_project'],
-            'suggested_action': "Create corresponding folder in Google Drive"
-        }
-    ]
+    """Provide sample inconsistencies for testing.
+
+    Returned as a tuple; tests that modify the list should use
+    ``list(sample_inconsistencies)``.
+    """
+    return (
+        _make_inc(
+            'missing_next_action',
+            "Area 'Evacuation Plan' has no @next actions",
+            'medium',
+            ['work_area_without_next'],
+            "Add at least one task with @next label to define the next action"
+        ),
+        _make_inc(
+            'status_mismatch',
+            "Status mismatch between Todoist and Google Drive",
+            'high',
+            ['work_project'],
+            "Update status to match across all tools"
+        ),
+        _make_inc(
+            'missing_item',
+            "Project not found in Google Drive",
+            'high',
+            ['personal_project'],
+            "Create corresponding folder in Google Drive"
+        )
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_args():
     """Provide mock command line arguments for testing."""
     args = Mock()
@@ -191,23 +239,13 @@ def mock_args():
     return args
 
 
+@pytest.fixture
+def mock_args_copy(mock_args):
+    """Provide a copy of the mock arguments that a test may modify."""
+    return copy.copy(mock_args)
+
+
 @pytest.fixture
 def temp_test_dir(tmp_path):
     """Provide a temporary directory for test files."""
     return tmp_path
-
-
-@pytest.fixture(autouse=True)
-def setup_test_environment(monkeypatch, tmp_path):
-    """Set up test environment variables and paths."""
-    # Set test environment variables
-    monkeypatch.setenv('PARA_AUDITOR_CONFIG', str(tmp_path / 'test_config.yaml'))
-    monkeypatch.setenv('PARA_AUDITOR_CREDENTIALS', str(tmp_path / 'credentials'))
-    
-    # Create test directories
-    (tmp_path / 'credentials').mkdir(exist_ok=True)
-    
-    yield
-    
-    # Cleanup (if needed)
-    pass
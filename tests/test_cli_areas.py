@@ -1,22 +1,38 @@
 """Tests for command line argument handling of area-related functionality."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import sys
-import argparse
+from unittest.mock import Mock, patch
 
-from src.main import create_parser, apply_filters, print_audit_configuration
+from src.main import MODE_HANDLERS, main, create_parser, apply_filters, print_audit_configuration, print_project_alignment_view
 from src.models.para_item import PARAItem, ItemType, ItemSource, CategoryType
 
 
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Provide the command line parser, built once per session."""
+    return create_parser()
+
+
+@pytest.fixture(scope="session")
+def parser_help(parser):
+    """Provide the parser help text with whitespace collapsed.
+
+    Collapsing whitespace keeps the assertions independent of how argparse
+    wraps long help strings.
+    """
+    return " ".join(parser.format_help().split())
+
+
 class TestCommandLineArguments:
     """Test command line argument parsing for area handling."""
     
-    def test_show_all_areas_argument_exists(self):
+    def test_show_all_areas_argument_exists(self, parser):
         """Test that --show-all-areas argument is properly defined."""
-        parser = create_parser()
-        
         # Check that the argument exists
         assert hasattr(parser, 'parse_args')
         
@@ -28,24 +44,16 @@ class TestCommandLineArguments:
         args = parser.parse_args([])
         assert args.show_all_areas is False
     
-    def test_show_all_areas_help_text(self):
+    def test_show_all_areas_help_text(self, parser_help):
         """Test that --show-all-areas has appropriate help text."""
-        parser = create_parser()
-        
-        # Get help text
-        help_text = parser.format_help()
-        
         # Should contain the flag description
-        assert '--show-all-areas' in help_text
-        assert 'Show all PARA areas in the report' in help_text
-        # The help text format shows the description on multiple lines
-        assert 'default: only show' in help_text
-        assert 'areas missing next actions' in help_text
+        assert '--show-all-areas' in parser_help
+        assert 'Show all PARA areas in the report' in parser_help
+        assert 'default: only show' in parser_help
+        assert 'areas missing next actions' in parser_help
     
-    def test_show_all_areas_with_other_flags(self):
+    def test_show_all_areas_with_other_flags(self, parser):
         """Test that --show-all-areas works with other relevant flags."""
-        parser = create_parser()
-        
         # Test with areas-only flag
         args = parser.parse_args(['--areas-only', '--show-all-areas'])
         assert args.areas_only is True
@@ -66,10 +74,8 @@ class TestCommandLineArguments:
         assert args.personal_only is True
         assert args.show_all_areas is True
     
-    def test_show_all_areas_mutual_exclusivity(self):
+    def test_show_all_areas_mutual_exclusivity(self, parser):
         """Test that --show-all-areas doesn't conflict with other flags."""
-        parser = create_parser()
-        
         # These should all work together
         args = parser.parse_args([
             '--show-all-areas',
@@ -84,231 +90,202 @@ class TestCommandLineArguments:
         assert args.format == 'json'
 
 
+@pytest.fixture(scope="session")
+def work_project():
+    """Provide an active work project."""
+    return PARAItem(
+        name="Work Project",
+        raw_name="💼 Work Project",
+        type=ItemType.PROJECT,
+        is_active=True,
+        category=CategoryType.WORK,
+        source=ItemSource.TODOIST,
+        metadata={'has_next_action': True}
+    )
+
+
+@pytest.fixture(scope="session")
+def personal_project():
+    """Provide an active personal project."""
+    return PARAItem(
+        name="Personal Project",
+        raw_name="🏠 Personal Project",
+        type=ItemType.PROJECT,
+        is_active=True,
+        category=CategoryType.PERSONAL,
+        source=ItemSource.TODOIST,
+        metadata={'has_next_action': True}
+    )
+
+
+@pytest.fixture(scope="session")
+def work_area_with_next():
+    """Provide a work area with a next action."""
+    return PARAItem(
+        name="Work Area",
+        raw_name="📋 Work Area",
+        type=ItemType.AREA,
+        is_active=False,
+        category=CategoryType.WORK,
+        source=ItemSource.TODOIST,
+        metadata={'has_next_action': True}
+    )
+
+
+@pytest.fixture(scope="session")
+def work_area_without_next():
+    """Provide a work area without a next action."""
+    return PARAItem(
+        name="Work Area No Next",
+        raw_name="📋 Work Area No Next",
+        type=ItemType.AREA,
+        is_active=False,
+        category=CategoryType.WORK,
+        source=ItemSource.TODOIST,
+        metadata={'has_next_action': False}
+    )
+
+
+@pytest.fixture(scope="session")
+def personal_area_with_next():
+    """Provide a personal area with a next action."""
+    return PARAItem(
+        name="Personal Area",
+        raw_name="📋 Personal Area",
+        type=ItemType.AREA,
+        is_active=False,
+        category=CategoryType.PERSONAL,
+        source=ItemSource.TODOIST,
+        metadata={'has_next_action': True}
+    )
+
+
+@pytest.fixture(scope="session")
+def personal_area_without_next():
+    """Provide a personal area without a next action."""
+    return PARAItem(
+        name="Personal Area No Next",
+        raw_name="📋 Personal Area No Next",
+        type=ItemType.AREA,
+        is_active=False,
+        category=CategoryType.PERSONAL,
+        source=ItemSource.TODOIST,
+        metadata={'has_next_action': False}
+    )
+
+
+@pytest.fixture(scope="session")
+def all_items(work_project, personal_project, work_area_with_next,
+              work_area_without_next, personal_area_with_next, personal_area_without_next):
+    """Provide every filter test item as a read-only tuple."""
+    return (
+        work_project,
+        personal_project,
+        work_area_with_next,
+        work_area_without_next,
+        personal_area_with_next,
+        personal_area_without_next
+    )
+
+
 class TestFilteringLogic:
     """Test the filtering logic for areas."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.work_project = PARAItem(
-            name="Work Project",
-            raw_name="💼 Work Project",
-            type=ItemType.PROJECT,
-            is_active=True,
-            category=CategoryType.WORK,
-            source=ItemSource.TODOIST,
-            metadata={'has_next_action': True}
-        )
-        
-        self.personal_project = PARAItem(
-            name="Personal Project",
-            raw_name="🏠 Personal Project",
-            type=ItemType.PROJECT,
-            is_active=True,
-            category=CategoryType.PERSONAL,
-            source=ItemSource.TODOIST,
-            metadata={'has_next_action': True}
-        )
-        
-        self.work_area_with_next = PARAItem(
-            name="Work Area",
-            raw_name="📋 Work Area",
-            type=ItemType.AREA,
-            is_active=False,
-            category=CategoryType.WORK,
-            source=ItemSource.TODOIST,
-            metadata={'has_next_action': True}
-        )
-        
-        self.work_area_without_next = PARAItem(
-            name="Work Area No Next",
-            raw_name="📋 Work Area No Next",
-            type=ItemType.AREA,
-            is_active=False,
-            category=CategoryType.WORK,
-            source=ItemSource.TODOIST,
-            metadata={'has_next_action': False}
-        )
-        
-        self.personal_area_with_next = PARAItem(
-            name="Personal Area",
-            raw_name="📋 Personal Area",
-            type=ItemType.AREA,
-            is_active=False,
-            category=CategoryType.PERSONAL,
-            source=ItemSource.TODOIST,
-            metadata={'has_next_action': True}
-        )
-        
-        self.personal_area_without_next = PARAItem(
-            name="Personal Area No Next",
-            raw_name="📋 Personal Area No Next",
-            type=ItemType.AREA,
-            is_active=False,
-            category=CategoryType.PERSONAL,
-            source=ItemSource.TODOIST,
-            metadata={'has_next_action': False}
-        )
-        
-        self.all_items = [
-            self.work_project,
-            self.personal_project,
-            self.work_area_with_next,
-            self.work_area_without_next,
-            self.personal_area_with_next,
-            self.personal_area_without_next
-        ]
-    
-    def test_areas_only_filter(self):
-        """Test that --areas-only filter works correctly."""
-        args = Mock()
-        args.areas_only = True
-        args.work_only = False
-        args.personal_only = False
-        args.projects_only = False
-        
-        filtered = apply_filters(self.all_items, args)
-        
-        # Should only include areas
-        assert len(filtered) == 4
-        assert all(item.type == ItemType.AREA for item in filtered)
-        assert self.work_project not in filtered
-        assert self.personal_project not in filtered
+    @pytest.mark.parametrize("flag,expected_count,predicate", [
+        ("areas_only", 4, lambda item: item.type == ItemType.AREA),
+        ("projects_only", 2, lambda item: item.type == ItemType.PROJECT),
+        ("work_only", 3, lambda item: item.category == CategoryType.WORK),
+        ("personal_only", 3, lambda item: item.category == CategoryType.PERSONAL)
+    ], ids=["areas_only", "projects_only", "work_only", "personal_only"])
+    def test_single_filter(self, all_items, flag, expected_count, predicate):
+        """Test that each --*-only filter keeps exactly the matching items."""
+        args = SimpleNamespace(areas_only=False, work_only=False, personal_only=False, projects_only=False)
+        setattr(args, flag, True)
+        
+        filtered = apply_filters(all_items, args)
+        
+        assert len(filtered) == expected_count
+        assert all(predicate(item) for item in filtered)
     
-    def test_projects_only_filter(self):
-        """Test that --projects-only filter works correctly."""
-        args = Mock()
-        args.areas_only = False
-        args.work_only = False
-        args.personal_only = False
-        args.projects_only = True
-        
-        filtered = apply_filters(self.all_items, args)
-        
-        # Should only include projects
-        assert len(filtered) == 2
-        assert all(item.type == ItemType.PROJECT for item in filtered)
-        assert self.work_area_with_next not in filtered
-        assert self.personal_area_without_next not in filtered
-    
-    def test_work_only_filter(self):
-        """Test that --work-only filter works correctly."""
-        args = Mock()
-        args.areas_only = False
-        args.work_only = True
-        args.personal_only = False
-        args.projects_only = False
-        
-        filtered = apply_filters(self.all_items, args)
-        
-        # Should only include work items
-        assert len(filtered) == 3
-        assert all(item.category == CategoryType.WORK for item in filtered)
-        assert self.personal_project not in filtered
-        assert self.personal_area_with_next not in filtered
-    
-    def test_personal_only_filter(self):
-        """Test that --personal-only filter works correctly."""
-        args = Mock()
-        args.areas_only = False
-        args.work_only = False
-        args.personal_only = True
-        args.projects_only = False
-        
-        filtered = apply_filters(self.all_items, args)
-        
-        # Should only include personal items
-        assert len(filtered) == 3
-        assert all(item.category == CategoryType.PERSONAL for item in filtered)
-        assert self.work_project not in filtered
-        assert self.work_area_with_next not in filtered
-    
-    def test_combined_filters(self):
+    def test_combined_filters(self, all_items, work_area_with_next, work_area_without_next):
         """Test that filters can be combined logically."""
-        args = Mock()
-        args.areas_only = True
-        args.work_only = True
-        args.personal_only = False
-        args.projects_only = False
+        args = SimpleNamespace(areas_only=True, work_only=True, personal_only=False, projects_only=False)
         
-        filtered = apply_filters(self.all_items, args)
+        filtered = apply_filters(all_items, args)
         
         # Should only include work areas
         assert len(filtered) == 2
         assert all(item.type == ItemType.AREA and item.category == CategoryType.WORK for item in filtered)
-        assert self.work_area_with_next in filtered
-        assert self.work_area_without_next in filtered
+        assert work_area_with_next in filtered
+        assert work_area_without_next in filtered
 
 
 class TestConfigurationDisplay:
     """Test the configuration display for area handling."""
     
-    def test_show_all_areas_configuration_display(self):
-        """Test that show_all_areas setting is displayed in configuration."""
-        # Mock config manager
-        config_manager = Mock()
-        config_manager.work_domain = "@company.com"
-        config_manager.personal_domain = "@gmail.com"
-        config_manager.projects_folder = "Projects"
-        config_manager.areas_folder = "Areas"
-        config_manager.next_action_label = "next"
-        
-        # Test with show_all_areas=True
-        args = Mock()
-        args.threshold = 0.8
-        args.work_only = False
-        args.personal_only = False
-        args.projects_only = False
-        args.areas_only = False
-        args.show_all_areas = True
-        args.next_action_label = None
-        args.skip_next_actions = False
-        
-        # Capture stdout to check output
-        import io
-        from contextlib import redirect_stdout
-        
-        f = io.StringIO()
-        with redirect_stdout(f):
-            print_audit_configuration(config_manager, args)
-        
-        output = f.getvalue()
-        
-        # Should show the show_all_areas setting
-        assert "Show All Areas: Yes" in output
+    @pytest.fixture
+    def config_manager(self):
+        """Provide a fresh mock configuration manager for each test."""
+        return Mock(
+            work_domain="@company.com",
+            personal_domain="@gmail.com",
+            projects_folder="Projects",
+            areas_folder="Areas",
+            next_action_label="next"
+        )
     
-    def test_show_all_areas_configuration_display_default(self):
-        """Test that show_all_areas default is displayed in configuration."""
-        # Mock config manager
-        config_manager = Mock()
-        config_manager.work_domain = "@company.com"
-        config_manager.personal_domain = "@gmail.com"
-        config_manager.projects_folder = "Projects"
-        config_manager.areas_folder = "Areas"
-        config_manager.next_action_label = "next"
-        
-        # Test with show_all_areas=False (default)
-        args = Mock()
-        args.threshold = 0.8
-        args.work_only = False
-        args.personal_only = False
-        args.projects_only = False
-        args.areas_only = False
-        args.show_all_areas = False
-        args.next_action_label = None
-        args.skip_next_actions = False
+    @pytest.mark.parametrize("show_all_areas, expected", [
+        (True, "Show All Areas: Yes"),
+        (False, "Show All Areas: No (default)"),
+    ])
+    def test_show_all_areas_configuration_display(self, config_manager, show_all_areas, expected, capsys):
+        """Test that the show_all_areas setting is displayed in configuration."""
+        args = Mock(
+            threshold=0.8,
+            work_only=False,
+            personal_only=False,
+            projects_only=False,
+            areas_only=False,
+            show_all_areas=show_all_areas,
+            next_action_label=None,
+            skip_next_actions=False
+        )
         
-        # Capture stdout to check output
-        import io
-        from contextlib import redirect_stdout
+        print_audit_configuration(config_manager, args)
         
-        f = io.StringIO()
-        with redirect_stdout(f):
-            print_audit_configuration(config_manager, args)
+        output = capsys.readouterr().out
         
-        output = f.getvalue()
+        assert expected in output
+
+
+class TestThresholdValidation:
+    """Test that --threshold is only validated for audits."""
+    
+    @pytest.fixture(autouse=True)
+    def no_logging_setup(self):
+        """Keep main() from reconfiguring logging for the test session."""
+        with patch('src.main.setup_logging'):
+            yield
+    
+    def test_out_of_range_threshold_rejected_for_audit(self, capsys):
+        """Test that an audit with an out-of-range threshold fails early."""
+        with patch('src.main.handle_audit_mode') as handle_audit_mode:
+            assert main(['--threshold', '1.5']) == 1
         
-        # Should show the default setting
-        assert "Show All Areas: No (default)" in output
+        handle_audit_mode.assert_not_called()
+        assert "Threshold must be between 0.0 and 1.0" in capsys.readouterr().out
+    
+    @pytest.mark.parametrize("mode, argv", [
+        ('setup', ['--setup']),
+        ('create_config', ['--create-config']),
+    ])
+    def test_out_of_range_threshold_ignored_outside_audit(self, mode, argv):
+        """Test that modes that never use the threshold do not validate it."""
+        handler = Mock(return_value=0)
+        with patch.dict(MODE_HANDLERS, {mode: handler}):
+            assert main(argv + ['--threshold', '1.5']) == 0
+        
+        handler.assert_called_once()
 
 
 class TestIntegration:
@@ -321,8 +298,6 @@ class TestIntegration:
         mock_get_issues.return_value = []
         
         # Create a simple test scenario
-        from src.main import print_project_alignment_view
-        
         all_items = [
             PARAItem(
                 name="Test Area",
@@ -335,15 +310,10 @@ class TestIntegration:
             )
         ]
         
-        comparison_result = Mock()
-        comparison_result.item_groups = [all_items]
+        comparison_result = SimpleNamespace(item_groups=[all_items])
         
         # This should not crash and should handle areas correctly
-        try:
-            print_project_alignment_view(all_items, comparison_result)
-            assert True  # If we get here, it worked
-        except Exception as e:
-            pytest.fail(f"End-to-end test failed: {e}")
+        print_project_alignment_view(all_items, comparison_result)
 
 
 if __name__ == "__main__":
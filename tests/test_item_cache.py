@@ -0,0 +1,123 @@
+"""Tests for the on-disk collected item cache."""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.main import handle_audit_mode
+from src.utils.item_cache import ItemCache
+
+
+class TestItemCache:
+    """Test saving and loading collected items."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        """Path to a cache file inside a not-yet-created directory."""
+        return tmp_path / 'cache' / 'items.json'
+
+    @pytest.fixture
+    def items(self, sample_para_items):
+        """Sample items as collected from all sources."""
+        return list(sample_para_items.values())
+
+    @pytest.fixture
+    def config_key(self):
+        """Cache key for a sample configuration."""
+        return ItemCache.config_key({'todoist': {'api_token': 'test'}}, {'skip_next_actions': False})
+
+    def test_round_trip_preserves_items(self, cache_path, config_key, items):
+        """Test that cached items load back equal to the saved items."""
+        cache = ItemCache(ttl=60, cache_path=cache_path)
+        cache.save(config_key, items)
+
+        loaded = cache.load(config_key)
+
+        assert loaded == items
+        assert [item.raw_name for item in loaded] == [item.raw_name for item in items]
+        assert [item.metadata for item in loaded] == [item.metadata for item in items]
+
+    def test_config_change_invalidates_cache(self, cache_path, config_key, items):
+        """Test that a different configuration does not reuse the cache."""
+        cache = ItemCache(ttl=60, cache_path=cache_path)
+        cache.save(config_key, items)
+
+        other_key = ItemCache.config_key({'todoist': {'api_token': 'other'}}, {'skip_next_actions': False})
+
+        assert other_key != config_key
+        assert cache.load(other_key) is None
+
+    def test_expired_cache_is_ignored(self, cache_path, config_key, items):
+        """Test that a cache older than the TTL is not used."""
+        cache = ItemCache(ttl=60, cache_path=cache_path)
+        cache.save(config_key, items)
+
+        stale = time.time() - 120
+        os.utime(cache_path, (stale, stale))
+
+        assert cache.load(config_key) is None
+
+    def test_missing_or_corrupt_cache_returns_none(self, cache_path, config_key):
+        """Test that unreadable caches are treated as absent."""
+        cache = ItemCache(ttl=60, cache_path=cache_path)
+        assert cache.load(config_key) is None
+
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_text('{not json')
+        assert cache.load(config_key) is None
+
+        cache_path.write_text('[]')
+        assert cache.load(config_key) is None
+
+
+class TestAuditCacheLookup:
+    """Test that audits consult the cache before checking authentication."""
+
+    @pytest.fixture
+    def config_manager(self):
+        """Mock configuration manager with loaded configuration data."""
+        return Mock(config_data={'todoist': {'api_token': 'test'}})
+
+    @pytest.fixture
+    def audit_args(self):
+        """Quiet audit arguments with the cache enabled."""
+        return SimpleNamespace(
+            verbose=False, quiet=True, dry_run=False, cache_ttl=60, no_cache=False,
+            next_action_label=None, skip_next_actions=False, work_only=False,
+            personal_only=False, projects_only=False, areas_only=False,
+            threshold=0.8, format='markdown', output=None, show_all_areas=False
+        )
+
+    @pytest.fixture(autouse=True)
+    def cache_path(self, tmp_path, monkeypatch):
+        """Point the default cache location at a temporary file."""
+        path = tmp_path / 'items.json'
+        monkeypatch.setattr('src.utils.item_cache.DEFAULT_CACHE_PATH', path)
+        return path
+
+    @pytest.fixture(autouse=True)
+    def check_authentication(self):
+        """Stand in for the network authentication checks, reporting failure."""
+        with patch('src.main.enable_file_logging'), \
+                patch('src.main.check_audit_authentication', return_value=None) as check:
+            yield check
+
+    def test_cache_hit_skips_authentication(self, config_manager, audit_args, cache_path,
+                                            check_authentication, sample_para_items):
+        """Test that cached items are audited without contacting any service."""
+        config_key = ItemCache.config_key(config_manager.config_data, {
+            'next_action_label': None,
+            'skip_next_actions': False
+        })
+        ItemCache(ttl=60, cache_path=cache_path).save(config_key, list(sample_para_items.values()))
+
+        assert handle_audit_mode(config_manager, audit_args) == 0
+        check_authentication.assert_not_called()
+
+    def test_cache_miss_checks_authentication(self, config_manager, audit_args, check_authentication):
+        """Test that collecting fresh items still requires authentication."""
+        assert handle_audit_mode(config_manager, audit_args) == 1
+        check_authentication.assert_called_once()
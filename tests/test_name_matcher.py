@@ -0,0 +1,27 @@
+"""Tests for fuzzy name grouping."""
+
+import pytest
+
+from src.utils.name_matcher import NameMatcher
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestGroupSimilarNames:
+    """Test that grouping agrees with pairwise matching."""
+
+    def test_groups_matches_without_shared_word_or_trigram(self):
+        """Test that matching names sharing no word or trigram are grouped."""
+        matcher = NameMatcher()
+
+        assert matcher.is_match('todo', 'to do')
+        assert matcher.group_similar_names(['todo', 'to do']) == [['todo', 'to do']]
+
+    def test_keeps_unrelated_names_apart(self):
+        """Test that names below the threshold stay in separate groups."""
+        matcher = NameMatcher()
+
+        groups = matcher.group_similar_names(['Home Renovation', 'Taxes', 'home renovation'])
+
+        assert groups == [['Home Renovation', 'home renovation'], ['Taxes']]
@@ -0,0 +1,172 @@
+"""Tests for PARAItem name similarity, hashing and bulk creation."""
+
+import random
+
+import pytest
+
+from src.models import para_item
+from src.models.para_item import (
+    PARAItem, ItemType, ItemSource, CategoryType,
+    _jaro_winkler_similarity, _jaro_winkler_upper_bound
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestJaroWinklerSimilarity:
+    """Test the pure-Python Jaro-Winkler fallback."""
+
+    @pytest.mark.parametrize("name1, name2, expected", [
+        ('martha', 'marhta', 0.9611),
+        ('dwayne', 'duane', 0.84),
+        ('dixon', 'dicksonx', 0.8133),
+    ])
+    def test_textbook_values(self, name1, name2, expected):
+        """Test the standard examples from the Jaro-Winkler literature."""
+        assert _jaro_winkler_similarity(name1, name2) == pytest.approx(expected, abs=1e-4)
+
+    def test_empty_strings(self):
+        """Test that an empty name only matches another empty name, as in rapidfuzz."""
+        assert _jaro_winkler_similarity('', 'martha') == 0.0
+        assert _jaro_winkler_similarity('martha', '') == 0.0
+        assert _jaro_winkler_similarity('', '') == 1.0
+
+    def test_identical_strings(self):
+        """Test that identical names score 1.0."""
+        assert _jaro_winkler_similarity('martha', 'martha') == pytest.approx(1.0)
+
+    def test_no_common_characters(self):
+        """Test that names sharing no characters score 0.0."""
+        assert _jaro_winkler_similarity('abc', 'xyz') == 0.0
+
+    def test_upper_bound_is_never_below_score(self):
+        """Test that pruning on the upper bound can never drop a real match."""
+        rng = random.Random(0)
+        for _ in range(2000):
+            name1 = ''.join(rng.choice('abcd ') for _ in range(rng.randint(1, 12)))
+            name2 = ''.join(rng.choice('abcd ') for _ in range(rng.randint(1, 12)))
+            assert _jaro_winkler_upper_bound(name1, name2) >= _jaro_winkler_similarity(name1, name2) - 1e-12
+
+    def test_matches_rapidfuzz(self):
+        """Test that the fallback agrees with the rapidfuzz implementation."""
+        jaro_winkler = pytest.importorskip('rapidfuzz.distance').JaroWinkler
+        rng = random.Random(0)
+        for _ in range(2000):
+            name1 = ''.join(rng.choice('abcd ') for _ in range(rng.randint(0, 12)))
+            name2 = ''.join(rng.choice('abcd ') for _ in range(rng.randint(0, 12)))
+            expected = jaro_winkler.normalized_similarity(name1, name2)
+            assert _jaro_winkler_similarity(name1, name2) == pytest.approx(expected), (name1, name2)
+
+
+class TestMatchesName:
+    """Test PARAItem.matches_name on the pure-Python path."""
+
+    @pytest.fixture(autouse=True)
+    def pure_python(self, monkeypatch):
+        """Force the pure-Python fallback even when rapidfuzz is installed."""
+        monkeypatch.setattr(para_item, 'JaroWinkler', None)
+
+    @pytest.fixture
+    def item(self):
+        """A project named 'Website'."""
+        return PARAItem(
+            name='Website',
+            type=ItemType.PROJECT,
+            is_active=True,
+            category=CategoryType.WORK,
+            source=ItemSource.TODOIST
+        )
+
+    def test_prefix_name_matches(self, item):
+        """Test that a name extending this one matches under Jaro-Winkler.
+
+        The previous length-ratio comparison scored 'website' against
+        'website redesign' at 7/16 and rejected it.
+        """
+        assert item.matches_name('Website Redesign')
+
+    def test_unrelated_name_does_not_match(self, item):
+        """Test that an unrelated name is rejected."""
+        assert not item.matches_name('Garden')
+
+    def test_empty_name_does_not_match(self, item):
+        """Test that an empty name is rejected."""
+        assert not item.matches_name('')
+
+
+class TestHash:
+    """Test PARAItem hashing."""
+
+    def test_hash_follows_mutation(self):
+        """Test that the hash tracks a changed category without any reset."""
+        item = PARAItem(
+            name='Website',
+            type=ItemType.PROJECT,
+            is_active=True,
+            category=CategoryType.WORK,
+            source=ItemSource.GDRIVE_WORK
+        )
+        hash(item)
+
+        item.category = CategoryType.PERSONAL
+        twin = PARAItem(
+            name='Website',
+            type=ItemType.PROJECT,
+            is_active=True,
+            category=CategoryType.PERSONAL,
+            source=ItemSource.GDRIVE_WORK
+        )
+
+        assert item == twin
+        assert hash(item) == hash(twin)
+
+
+class TestBulkCreate:
+    """Test building items in bulk."""
+
+    @pytest.fixture
+    def rows(self):
+        """Constructor keywords as built by the Drive and Apple Notes connectors."""
+        return [
+            {
+                'name': '🏠 Home Renovation!',
+                'type': ItemType.PROJECT,
+                'is_active': True,
+                'category': CategoryType.PERSONAL,
+                'source': ItemSource.GDRIVE_PERSONAL,
+                'metadata': {'folder_id': 'a'}
+            },
+            {
+                'name': '🏠 Home Renovation!',
+                'type': ItemType.PROJECT,
+                'is_active': True,
+                'category': CategoryType.PERSONAL,
+                'source': ItemSource.APPLE_NOTES,
+                'raw_name': 'Home Renovation'
+            },
+            {
+                'name': '  Q3   Budget ',
+                'type': ItemType.AREA,
+                'is_active': False,
+                'category': CategoryType.WORK,
+                'source': ItemSource.GDRIVE_WORK
+            },
+        ]
+
+    def test_matches_constructor(self, rows):
+        """Test that bulk_create builds the same items as the constructor."""
+        items = PARAItem.bulk_create(rows)
+        expected = [PARAItem(**row) for row in rows]
+
+        assert [(item.name, item.raw_name, item.type, item.is_active, item.category, item.source, item.metadata)
+                for item in items] == \
+               [(item.name, item.raw_name, item.type, item.is_active, item.category, item.source, item.metadata)
+                for item in expected]
+
+    def test_rejects_empty_names(self, rows):
+        """Test that names normalizing to nothing are rejected as by the constructor."""
+        rows[0]['name'] = '!!!'
+
+        with pytest.raises(ValueError):
+            PARAItem.bulk_create(rows)